@@ -14,6 +14,7 @@ Usage:
 """
 
 import argparse
+import csv
 import sys
 from pathlib import Path
 import numpy as np
@@ -255,8 +256,6 @@ def analyze_study(study_name: str, update_csv: bool = False) -> list:
 
 def update_study_csv(study_name: str, results: list):
     """Met a jour le CSV de l'etude avec les colonnes overflow."""
-    import csv
-
     project_root = Path(__file__).parent.parent
     csv_path = project_root / "results" / study_name / "simulations.csv"
 
@@ -264,11 +263,12 @@ def update_study_csv(study_name: str, results: list):
         print(f"\nWarning: CSV not found: {csv_path}")
         return
 
-    # Lire le CSV existant
+    # Lire le CSV existant (listes, pas un dict par ligne); comme avec
+    # DictReader, les lignes vides sont ignorees
     with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-        fieldnames = reader.fieldnames.copy()
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
+        rows = [row for row in reader if row]
 
     # Ajouter les nouvelles colonnes si necessaire
     new_fields = ['overflow_left_um', 'overflow_right_um', 'has_overflow']
@@ -276,26 +276,34 @@ def update_study_csv(study_name: str, results: list):
         if field not in fieldnames:
             fieldnames.append(field)
 
+    # Indices des colonnes resolus une seule fois depuis l'en-tete
+    width = len(fieldnames)
+    run_idx = fieldnames.index('run_name') if 'run_name' in fieldnames else None
+    left_idx, right_idx, has_idx = (fieldnames.index(field) for field in new_fields)
+
     # Creer un dict des resultats par run_name
     results_dict = {r['run_name']: r for r in results}
 
-    # Mettre a jour les rows
+    # Mettre a jour les rows; une ligne plus courte que l'en-tete est
+    # completee par des champs vides avant indexation (comme DictReader)
     for row in rows:
-        run_name = row.get('run_name', '')
+        if len(row) < width:
+            row.extend([''] * (width - len(row)))
+        run_name = row[run_idx] if run_idx is not None else ''
         if run_name in results_dict:
             r = results_dict[run_name]
-            row['overflow_left_um'] = f"{r['overflow_left_um']:.1f}"
-            row['overflow_right_um'] = f"{r['overflow_right_um']:.1f}"
-            row['has_overflow'] = 'YES' if (r['has_overflow_left'] or r['has_overflow_right']) else 'NO'
+            row[left_idx] = f"{r['overflow_left_um']:.1f}"
+            row[right_idx] = f"{r['overflow_right_um']:.1f}"
+            row[has_idx] = 'YES' if (r['has_overflow_left'] or r['has_overflow_right']) else 'NO'
         else:
-            row['overflow_left_um'] = ''
-            row['overflow_right_um'] = ''
-            row['has_overflow'] = ''
+            row[left_idx] = ''
+            row[right_idx] = ''
+            row[has_idx] = ''
 
     # Ecrire le CSV mis a jour
     with open(csv_path, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
         writer.writerows(rows)
 
     print(f"\n✓ CSV mis a jour: {csv_path}")
@@ -36,7 +36,7 @@ def get_study_info(study_name):
     
     if config_file.exists():
         with open(config_file) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
         return config
     return {}
 
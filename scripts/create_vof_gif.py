@@ -39,6 +39,17 @@ WALL_COLOR = 'black'
 WALL_LINE_WIDTH = 2
 FONT_SIZE = 11
 
+# Parse OpenFOAM dictionary format: "key value;"
+# Handles both "key value;" and "key value; // comment"
+_PARAM_LINE_RE = re.compile(r'^\s*(\w+)\s+([^;]+);')
+
+# Run-name fields (run_001_eta00.5_wall_isolant_left35_substrate75) and VTK
+# time index, compiled once
+_RUN_ETA0_RE = re.compile(r'eta0([\d.]+)')
+_RUN_CA_LEFT_RE = re.compile(r'wall_isolant_left(\d+)')
+_RUN_CA_SUBSTRATE_RE = re.compile(r'substrate(\d+)')
+_VTK_INDEX_RE = re.compile(r'_(\d+)\.vtk$')
+
 # Wall patches to render as black lines
 WALL_PATCHES = [
     'substrate',
@@ -86,17 +97,13 @@ def read_openfoam_parameters(case_dir: Path) -> dict:
     with open(params_file, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    # Parse OpenFOAM dictionary format: "key value;"
-    # Handle both "key value;" and "key value; // comment"
-    pattern = r'^\s*(\w+)\s+([^;]+);'
-
     for line in content.split('\n'):
         # Skip comments and empty lines
         line = line.strip()
         if not line or line.startswith('//') or line.startswith('/*'):
             continue
 
-        match = re.match(pattern, line)
+        match = _PARAM_LINE_RE.match(line)
         if match:
             key = match.group(1)
             value_str = match.group(2).strip()
@@ -154,16 +161,16 @@ def get_run_parameters(run_dir: Path) -> dict:
     # Parse run name for overridden values: run_001_eta00.5_wall_isolant_left35_substrate75
     name = run_dir.name
 
-    match = re.search(r'eta0([\d.]+)', name)
+    match = _RUN_ETA0_RE.search(name)
     if match:
         params['eta_0'] = float(match.group(1))
 
-    match = re.search(r'wall_isolant_left(\d+)', name)
+    match = _RUN_CA_LEFT_RE.search(name)
     if match:
         params['CA_wall_isolant_left'] = int(match.group(1))
         # wall_isolant_right reste constant (defaut 90), ne pas copier left!
 
-    match = re.search(r'substrate(\d+)', name)
+    match = _RUN_CA_SUBSTRATE_RE.search(name)
     if match:
         params['CA_substrate'] = int(match.group(1))
 
@@ -436,14 +443,14 @@ def process_run(run_dir: Path, output_dir: Path) -> tuple:
     vtk_files = list(vtk_dir.glob("*.vtk"))
 
     # Filter to internal mesh files (main series, not boundary patch directories)
-    internal_files = [f for f in vtk_files if re.match(r'.*_\d+\.vtk$', f.name)]
-
-    # Sort numerically by time index
-    def extract_time_index(filepath):
-        match = re.search(r'_(\d+)\.vtk$', filepath.name)
-        return int(match.group(1)) if match else 0
-
-    internal_files = sorted(internal_files, key=extract_time_index)
+    # and sort numerically by time index, with a single match per file
+    indexed = []
+    for f in vtk_files:
+        match = _VTK_INDEX_RE.search(f.name)
+        if match:
+            indexed.append((int(match.group(1)), f))
+    indexed.sort(key=lambda item: item[0])
+    internal_files = [f for _, f in indexed]
 
     if not internal_files:
         print(f"  ERROR: No VTK files found in {vtk_dir}")
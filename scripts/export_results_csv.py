@@ -15,8 +15,12 @@ Output:
 
 import argparse
 import csv
+import os
 from pathlib import Path
-from openfoam_params import read_parameters, get_geometry, get_contact_angles
+
+import numpy as np
+from openfoam_params import (read_parameters, get_geometry, get_contact_angles,
+                             parse_solver_log)
 
 # =============================================================================
 # CONFIGURATION
@@ -77,16 +81,15 @@ CSV_COLUMNS = [
     'maxCo',
 ]
 
+# Columns copied verbatim from system/parameters
+PARAM_COLUMNS = (
+    'rho_ink', 'eta_0', 'eta_inf', 'sigma', 'n_carreau',
+    'endTime', 'writeInterval', 'deltaT', 'maxCo',
+)
 
-def get_run_status(run_dir: Path) -> tuple:
-    """Check simulation status from log file."""
-    log_file = run_dir / "run.log"
-
-    if not log_file.exists():
-        return "NO_LOG", None
-
-    content = log_file.read_text()
 
+def _parse_log(content: str) -> tuple:
+    """Return (status, final time) from (part of) a solver log."""
     # Extract final time
     final_time = None
     for line in reversed(content.split('\n')):
@@ -105,26 +108,56 @@ def get_run_status(run_dir: Path) -> tuple:
         return "RUNNING", final_time
 
 
+def get_run_status(run_dir: Path) -> tuple:
+    """Check simulation status from log file (tail only, see parse_solver_log)."""
+    try:
+        return parse_solver_log(run_dir / "run.log", _parse_log)
+    except FileNotFoundError:
+        return "NO_LOG", None
+
+
+# Directory listings cached per directory (None = directory missing), so
+# output discovery costs one scandir per directory instead of a stat per file.
+# Only valid while one study is exported: export_study clears it
+_dir_cache = {}
+
+
+def _list_dir(directory: Path):
+    """Return the cached set of entry names in a directory (None if missing)."""
+    key = str(directory)
+    if key not in _dir_cache:
+        try:
+            with os.scandir(key) as it:
+                _dir_cache[key] = frozenset(e.name for e in it)
+        except (FileNotFoundError, NotADirectoryError):
+            _dir_cache[key] = None
+    return _dir_cache[key]
+
+
+def _find_in(name: str, *directories: Path) -> str:
+    """Return the path of the first directory containing name, or ''."""
+    for directory in directories:
+        entries = _list_dir(directory)
+        if entries is not None and name in entries:
+            return str(directory / name)
+    return ''
+
+
 def find_output_files(run_dir: Path, study_dir: Path) -> dict:
     """Find GIF and PNG files for a run."""
     run_name = run_dir.name
 
-    # Check in study's gifs/png folders
-    gif_path = study_dir / "gifs" / f"{run_name}.gif"
-    png_path = study_dir / "png" / f"{run_name}.png"
-
-    # Also check in run directory directly
-    if not gif_path.exists():
-        gif_path = run_dir / f"{run_name}.gif"
-    if not png_path.exists():
-        png_path = run_dir / f"{run_name}.png"
+    # Check in study's gifs/png folders, then in run directory directly
+    gif_path = _find_in(f"{run_name}.gif", study_dir / "gifs", run_dir)
+    png_path = _find_in(f"{run_name}.png", study_dir / "png", run_dir)
 
     # Check for VTK directory
-    vtk_available = (run_dir / "VTK").exists()
+    run_entries = _list_dir(run_dir)
+    vtk_available = run_entries is not None and "VTK" in run_entries
 
     return {
-        'gif_path': str(gif_path) if gif_path.exists() else '',
-        'png_path': str(png_path) if png_path.exists() else '',
+        'gif_path': gif_path,
+        'png_path': png_path,
         'vtk_available': vtk_available,
     }
 
@@ -153,12 +186,9 @@ def process_run(run_dir: Path, study_name: str) -> dict:
     # Find output files
     files = find_output_files(run_dir, study_dir)
 
-    # Calculate ratio
-    S_puit = geom.get('x_puit', 0.8) * geom.get('y_puit', 0.128)
-    S_buse = geom.get('x_buse', 0.3) * geom.get('y_buse', 0.341)
-    ratio = S_buse / S_puit if S_puit > 0 else 1.0
-
-    return {
+    # Every column defaults to '' so rows always match CSV_COLUMNS
+    row = dict.fromkeys(CSV_COLUMNS, '')
+    row.update({
         # Identification
         'study_name': study_name,
         'run_name': run_name,
@@ -173,41 +203,35 @@ def process_run(run_dir: Path, study_name: str) -> dict:
         'status': status,
         'final_time_s': final_time if final_time else '',
 
-        # Geometry
-        'x_puit': geom.get('x_puit', ''),
-        'y_puit': geom.get('y_puit', ''),
-        'x_buse': geom.get('x_buse', ''),
-        'y_buse': geom.get('y_buse', ''),
-        'y_gap_buse': geom.get('y_gap_buse', ''),
-        'x_gap_buse': geom.get('x_gap_buse', ''),
-        'x_plateau': geom.get('x_plateau', ''),
-        'ratio_surface': f"{ratio:.4f}",
-
-        # Physics
-        'rho_ink': params.get('rho_ink', ''),
-        'eta_0': params.get('eta_0', ''),
-        'eta_inf': params.get('eta_inf', ''),
-        'sigma': params.get('sigma', ''),
         'lambda_carreau': params.get('lambda', ''),
-        'n_carreau': params.get('n_carreau', ''),
-
-        # Contact angles
-        'CA_substrate': ca.get('CA_substrate', ''),
-        'CA_wall_isolant_left': ca.get('CA_wall_isolant_left', ''),
-        'CA_wall_isolant_right': ca.get('CA_wall_isolant_right', ''),
-        'CA_top_isolant_left': ca.get('CA_top_isolant_left', ''),
-        'CA_top_isolant_right': ca.get('CA_top_isolant_right', ''),
-        'CA_buse_int_left': ca.get('CA_buse_int_left', ''),
-        'CA_buse_int_right': ca.get('CA_buse_int_right', ''),
-        'CA_buse_ext_left': ca.get('CA_buse_ext_left', ''),
-        'CA_buse_ext_right': ca.get('CA_buse_ext_right', ''),
-
-        # Numerical
-        'endTime': params.get('endTime', ''),
-        'writeInterval': params.get('writeInterval', ''),
-        'deltaT': params.get('deltaT', ''),
-        'maxCo': params.get('maxCo', ''),
-    }
+    })
+
+    # Geometry and contact angles share their CSV column names
+    # (ratio_surface is filled for the whole study by fill_ratio_surface)
+    row.update(geom)
+    row.update(ca)
+
+    # Physics and numerical parameters copied as-is when present
+    for key in PARAM_COLUMNS:
+        if key in params:
+            row[key] = params[key]
+
+    return row
+
+
+def fill_ratio_surface(results: list):
+    """Compute ratio_surface = S_buse / S_puit for all rows in one NumPy pass."""
+    if not results:
+        return
+
+    geom = np.array([[r['x_puit'], r['y_puit'], r['x_buse'], r['y_buse']]
+                     for r in results], dtype=float)
+    S_puit = geom[:, 0] * geom[:, 1]
+    S_buse = geom[:, 2] * geom[:, 3]
+    ratios = np.where(S_puit > 0, S_buse / np.where(S_puit > 0, S_puit, 1.0), 1.0)
+
+    for row, ratio_str in zip(results, np.char.mod('%.4f', ratios)):
+        row['ratio_surface'] = str(ratio_str)
 
 
 def export_study(study_name: str) -> Path:
@@ -229,16 +253,22 @@ def export_study(study_name: str) -> Path:
     print(f"\n=== Exporting: {study_name} ===")
     print(f"Found {len(run_dirs)} runs")
 
-    # Process all runs
+    # Process all runs (fresh listings for this study only)
     results = []
-    for run_dir in run_dirs:
-        data = process_run(run_dir, study_name)
-        results.append(data)
-
-        status_icon = "OK" if data['status'] == "OK" else "ERR" if data['status'] == "ERROR" else "..."
-        gif_icon = "GIF" if data['gif_path'] else "---"
-        png_icon = "PNG" if data['png_path'] else "---"
-        print(f"  [{status_icon}] {data['run_name']} [{gif_icon}] [{png_icon}]")
+    _dir_cache.clear()
+    try:
+        for run_dir in run_dirs:
+            data = process_run(run_dir, study_name)
+            results.append(data)
+
+            status_icon = "OK" if data['status'] == "OK" else "ERR" if data['status'] == "ERROR" else "..."
+            gif_icon = "GIF" if data['gif_path'] else "---"
+            png_icon = "PNG" if data['png_path'] else "---"
+            print(f"  [{status_icon}] {data['run_name']} [{gif_icon}] [{png_icon}]")
+    finally:
+        _dir_cache.clear()
+
+    fill_ratio_surface(results)
 
     # Write CSV
     csv_path = study_dir / "simulations.csv"
@@ -16,142 +16,47 @@ Initial condition:
 IMPORTANT: L'inlet injecte de l'AIR (alpha=0) pour POUSSER l'encre vers le bas!
 """
 
+import mmap
+import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
-# Import centralized parameters reader
-from openfoam_params import read_parameters, get_contact_angles
-
-def read_cell_zone_labels(case_dir, zone_name):
-    """Read cell labels for a specific zone from cellZones file."""
-    cellzones_file = Path(case_dir) / "constant" / "polyMesh" / "cellZones"
-
-    with open(cellzones_file, 'r') as f:
-        content = f.read()
-
-    # Find the zone
-    zone_start = content.find(f"\n{zone_name}\n")
-    if zone_start < 0:
-        return []
-
-    # Find cellLabels List
-    labels_start = content.find("cellLabels", zone_start)
-    if labels_start < 0:
-        return []
-
-    # Find the count (number after List<label>)
-    count_start = content.find("\n", labels_start) + 1
-    count_end = content.find("\n", count_start)
-    count = int(content[count_start:count_end].strip())
-
-    # Find opening parenthesis
-    paren_start = content.find("(", count_end) + 1
-    paren_end = content.find(")", paren_start)
-
-    # Extract cell labels
-    labels_text = content[paren_start:paren_end]
-    labels = [int(x) for x in labels_text.split()]
-
-    return labels
-
-def get_num_cells(case_dir):
-    """Get number of cells from owner file"""
-    owner_file = Path(case_dir) / "constant" / "polyMesh" / "owner"
-
-    with open(owner_file, 'r') as f:
-        content = f.read()
-
-    # Find the number after FoamFile block
-    lines = content.split('\n')
-    foam_end = -1
-    for i, line in enumerate(lines):
-        if line.strip() == '}':
-            foam_end = i
-            break
-
-    # Find first number after }
-    for i in range(foam_end + 1, len(lines)):
-        stripped = lines[i].strip()
-        if stripped and stripped.isdigit():
-            return int(stripped)
-
-    raise ValueError("Could not find number of faces in owner file")
-
-def generate_alpha_field(case_dir, output_file, ca_override=None):
-    """Generate alpha.water field file with buse filled with ink
-
-    Args:
-        case_dir: Path to case directory
-        output_file: Output file path
-        ca_override: Dict to override contact angles (for parametric studies)
-    """
-
-    mesh_dir = Path(case_dir) / "constant" / "polyMesh"
+import numpy as np
 
-    # Read contact angles from centralized parameters
-    of_params = read_parameters(Path(case_dir))
-    ca = get_contact_angles(of_params)
+# Optional: numba speeds up the ASCII encoding of very large meshes
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
-    # Apply overrides if provided (for parametric studies)
-    if ca_override:
-        ca.update(ca_override)
-
-    print("Reading mesh info...")
+# Import centralized parameters reader
+from openfoam_params import read_parameters, get_contact_angles
 
-    # Get number of cells from owner file
-    owner_file = mesh_dir / "owner"
-    with open(owner_file, 'r') as f:
-        content = f.read()
-    lines = content.split('\n')
-    foam_end = -1
-    for i, line in enumerate(lines):
-        if line.strip() == '}':
-            foam_end = i
-            break
-
-    # Read all owner values to find max cell index
-    max_owner = -1
-    in_data = False
-    for i in range(foam_end + 1, len(lines)):
-        stripped = lines[i].strip()
-        if not stripped:
-            continue
-        if stripped == '(':
-            in_data = True
-            continue
-        if stripped == ')':
-            break
-        if in_data:
-            try:
-                val = int(stripped)
-                if val > max_owner:
-                    max_owner = val
-            except ValueError:
-                continue
-        elif stripped.isdigit():
-            continue  # This is the count line
 
-    num_cells = max_owner + 1
-    print(f"   Found {num_cells} cells")
+def _mask_to_ascii_numpy(mask):
+    """Encode a boolean mask as OpenFOAM ASCII lines ("0\\n" / "1\\n")."""
+    out = np.empty(2 * mask.size, dtype=np.uint8)
+    out[0::2] = mask.view(np.uint8) + ord('0')
+    out[1::2] = ord('\n')
+    return out
 
-    # Read buse zone cell labels
-    print("Reading buse cell zone...")
-    buse_cells = read_cell_zone_labels(case_dir, "buse")
-    print(f"   Found {len(buse_cells)} cells in buse zone")
 
-    # Create alpha field: 0 everywhere, 1 in buse
-    print("Setting initial conditions...")
-    print(f"   Buse cells: alpha = 1 (ink) - PRE-REMPLIE")
-    print(f"   All other cells: alpha = 0 (air)")
-    print(f"   Inlet BC: alpha = 0 (AIR qui pousse l'encre)")
+def _mask_to_ascii_loop(mask):
+    """Same as _mask_to_ascii_numpy, written as a loop for numba."""
+    n = mask.size
+    out = np.empty(2 * n, dtype=np.uint8)
+    for i in range(n):
+        out[2 * i] = 48 + mask[i]
+        out[2 * i + 1] = 10
+    return out
 
-    buse_set = set(buse_cells)
 
-    # Write OpenFOAM field file
-    print(f"Writing {output_file}...")
+mask_to_ascii = njit(cache=True)(_mask_to_ascii_loop) if njit else _mask_to_ascii_numpy
 
-    # Create header with contact angle values from parameters
-    header = f"""/*--------------------------------*- C++ -*----------------------------------*\\
+# OpenFOAM field templates, filled with str.format_map() at write time.
+# Contact angles are read from system/parameters.
+_HEADER_TEMPLATE = """/*--------------------------------*- C++ -*----------------------------------*\\
   =========                 |
   \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox
    \\\\    /   O peration     | Website:  https://openfoam.org
@@ -177,37 +82,28 @@ FoamFile
 // IMPORTANT: L'inlet injecte de l'AIR (alpha=0) pour pousser l'encre!
 //
 // Angles de contact (lus depuis system/parameters):
-//   - CA_substrate: {ca['CA_substrate']} deg
-//   - CA_wall_isolant_left: {ca['CA_wall_isolant_left']} deg
-//   - CA_wall_isolant_right: {ca['CA_wall_isolant_right']} deg
-//   - CA_top_isolant_left: {ca['CA_top_isolant_left']} deg
-//   - CA_top_isolant_right: {ca['CA_top_isolant_right']} deg
-//   - CA_buse_int_left: {ca['CA_buse_int_left']} deg
-//   - CA_buse_int_right: {ca['CA_buse_int_right']} deg
-//   - CA_buse_ext_left: {ca['CA_buse_ext_left']} deg
-//   - CA_buse_ext_right: {ca['CA_buse_ext_right']} deg
+//   - CA_substrate: {CA_substrate} deg
+//   - CA_wall_isolant_left: {CA_wall_isolant_left} deg
+//   - CA_wall_isolant_right: {CA_wall_isolant_right} deg
+//   - CA_top_isolant_left: {CA_top_isolant_left} deg
+//   - CA_top_isolant_right: {CA_top_isolant_right} deg
+//   - CA_buse_int_left: {CA_buse_int_left} deg
+//   - CA_buse_int_right: {CA_buse_int_right} deg
+//   - CA_buse_ext_left: {CA_buse_ext_left} deg
+//   - CA_buse_ext_right: {CA_buse_ext_right} deg
 
 dimensions      [];
 
+internalField   nonuniform List<scalar>
+{num_cells}
+(
 """
 
-    with open(output_file, 'w') as f:
-        f.write(header)
-
-        # Write internal field with non-uniform values
-        f.write(f"internalField   nonuniform List<scalar>\n{num_cells}\n(\n")
-
-        for cell_id in range(num_cells):
-            if cell_id in buse_set:
-                f.write("1\n")
-            else:
-                f.write("0\n")
-
-        f.write(")\n;\n\n")
+# Boundary field - GEOMETRY 2D COMPLETE avec patches gauche/droite separes
+_FOOTER_TEMPLATE = """)
+;
 
-        # Boundary field - GEOMETRY 2D COMPLETE avec patches gauche/droite separes
-        # Contact angles are read from system/parameters
-        f.write(f"""boundaryField
+boundaryField
 {{
     // === Faces 2D (empty) ===
     front
@@ -220,88 +116,7 @@ dimensions      [];
         type            empty;
     }}
 
-    // === Substrat (fond du puit) ===
-    substrate
-    {{
-        type            contactAngle;
-        theta0          {ca['CA_substrate']};
-        limit           gradient;
-        value           uniform 0;
-    }}
-
-    // === Paroi verticale de l'isolant GAUCHE ===
-    wall_isolant_left
-    {{
-        type            contactAngle;
-        theta0          {ca['CA_wall_isolant_left']};
-        limit           gradient;
-        value           uniform 0;
-    }}
-
-    // === Paroi verticale de l'isolant DROITE ===
-    wall_isolant_right
-    {{
-        type            contactAngle;
-        theta0          {ca['CA_wall_isolant_right']};
-        limit           gradient;
-        value           uniform 0;
-    }}
-
-    // === Surface horizontale de l'isolant GAUCHE ===
-    top_isolant_left
-    {{
-        type            contactAngle;
-        theta0          {ca['CA_top_isolant_left']};
-        limit           gradient;
-        value           uniform 0;
-    }}
-
-    // === Surface horizontale de l'isolant DROITE ===
-    top_isolant_right
-    {{
-        type            contactAngle;
-        theta0          {ca['CA_top_isolant_right']};
-        limit           gradient;
-        value           uniform 0;
-    }}
-
-    // === Paroi INTERIEURE de la buse GAUCHE ===
-    wall_buse_left_int
-    {{
-        type            contactAngle;
-        theta0          {ca['CA_buse_int_left']};
-        limit           gradient;
-        value           uniform 1;
-    }}
-
-    // === Paroi EXTERIEURE de la buse GAUCHE ===
-    wall_buse_left_ext
-    {{
-        type            contactAngle;
-        theta0          {ca['CA_buse_ext_left']};
-        limit           gradient;
-        value           uniform 0;
-    }}
-
-    // === Paroi INTERIEURE de la buse DROITE ===
-    wall_buse_right_int
-    {{
-        type            contactAngle;
-        theta0          {ca['CA_buse_int_right']};
-        limit           gradient;
-        value           uniform 1;
-    }}
-
-    // === Paroi EXTERIEURE de la buse DROITE ===
-    wall_buse_right_ext
-    {{
-        type            contactAngle;
-        theta0          {ca['CA_buse_ext_right']};
-        limit           gradient;
-        value           uniform 0;
-    }}
-
-    // === Inlet (haut de la buse) - AIR qui pousse l'encre ===
+{contact_angle_patches}    // === Inlet (haut de la buse) - AIR qui pousse l'encre ===
     inlet
     {{
         type            fixedValue;
@@ -334,7 +149,197 @@ dimensions      [];
 }}
 
 // ************************************************************************* //
-""")
+"""
+
+
+# Contact-angle walls: (comment, patch, parameter key, uniform value).
+# Rendered through _CONTACT_ANGLE_TEMPLATE and joined into the footer.
+_CONTACT_ANGLE_PATCHES = (
+    ("Substrat (fond du puit)", "substrate", "CA_substrate", 0),
+    ("Paroi verticale de l'isolant GAUCHE", "wall_isolant_left", "CA_wall_isolant_left", 0),
+    ("Paroi verticale de l'isolant DROITE", "wall_isolant_right", "CA_wall_isolant_right", 0),
+    ("Surface horizontale de l'isolant GAUCHE", "top_isolant_left", "CA_top_isolant_left", 0),
+    ("Surface horizontale de l'isolant DROITE", "top_isolant_right", "CA_top_isolant_right", 0),
+    ("Paroi INTERIEURE de la buse GAUCHE", "wall_buse_left_int", "CA_buse_int_left", 1),
+    ("Paroi EXTERIEURE de la buse GAUCHE", "wall_buse_left_ext", "CA_buse_ext_left", 0),
+    ("Paroi INTERIEURE de la buse DROITE", "wall_buse_right_int", "CA_buse_int_right", 1),
+    ("Paroi EXTERIEURE de la buse DROITE", "wall_buse_right_ext", "CA_buse_ext_right", 0),
+)
+
+_CONTACT_ANGLE_TEMPLATE = """    // === {comment} ===
+    {patch}
+    {{
+        type            contactAngle;
+        theta0          {theta};
+        limit           gradient;
+        value           uniform {value};
+    }}
+
+"""
+
+
+def format_contact_angle_patches(ca):
+    """Render the contactAngle boundary entries from a contact-angle dict."""
+    return ''.join(
+        _CONTACT_ANGLE_TEMPLATE.format(comment=comment, patch=patch, theta=ca[key], value=value)
+        for comment, patch, key, value in _CONTACT_ANGLE_PATCHES
+    )
+
+
+def write_chunks(path, chunks):
+    """Write a list of bytes-like chunks with a single writev() where available.
+
+    Chunks may be NumPy arrays: they are written from their own buffer,
+    without a bytes copy.
+    """
+    views = [memoryview(c).cast('B') for c in chunks]
+    with open(path, 'wb') as f:
+        if hasattr(os, 'writev'):
+            written = os.writev(f.fileno(), views)
+            # writev may stop short on very large buffers: finish chunk by chunk
+            for view in views:
+                if written >= len(view):
+                    written -= len(view)
+                    continue
+                f.write(view[written:])
+                written = 0
+        else:
+            for view in views:
+                f.write(view)
+
+
+@contextmanager
+def map_file(path):
+    """Memory-map a mesh file read-only, advising sequential access."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        yield mm
+
+
+def parse_label_block(buf, start):
+    """Parse the '( ... )' label list following offset `start` into an int64 array.
+
+    The labels are converted by NumPy directly from the mapped bytes: no
+    decoded copy of the file, no per-line split and int().
+    """
+    paren_start = buf.find(b"(", start)
+    paren_end = buf.find(b")", paren_start + 1) if paren_start >= 0 else -1
+    if paren_end < 0:
+        return np.empty(0, dtype=np.int64)
+    block = buf[paren_start + 1:paren_end]
+    # fromstring parses a whitespace-only block as [0]: an empty list
+    # ("0\n(\n)") must give no labels
+    if not block or block.isspace():
+        return np.empty(0, dtype=np.int64)
+    return np.fromstring(block, dtype=np.int64, sep=' ')
+
+
+def read_cell_zone_labels(case_dir, zone_name):
+    """Read cell labels for a specific zone from cellZones file (int64 array)."""
+    cellzones_file = Path(case_dir) / "constant" / "polyMesh" / "cellZones"
+
+    with map_file(cellzones_file) as mm:
+        # Find the zone
+        zone_start = mm.find(f"\n{zone_name}\n".encode())
+        if zone_start < 0:
+            return np.empty(0, dtype=np.int64)
+
+        # Find cellLabels List
+        labels_start = mm.find(b"cellLabels", zone_start)
+        if labels_start < 0:
+            return np.empty(0, dtype=np.int64)
+
+        # Skip the count line (number after List<label>), then parse the list
+        count_start = mm.find(b"\n", labels_start) + 1
+        count_end = mm.find(b"\n", count_start)
+        return parse_label_block(mm, count_end)
+
+
+def get_num_cells(case_dir):
+    """Get number of cells from owner file"""
+    owner_file = Path(case_dir) / "constant" / "polyMesh" / "owner"
+
+    with map_file(owner_file) as mm:
+        # Find the number after FoamFile block: only the lines up to the
+        # count are looked at, not the whole label list
+        pos = mm.find(b"\n}")
+        if pos >= 0:
+            paren = mm.find(b"(", pos)
+            header = mm[pos + 2:paren if paren >= 0 else len(mm)]
+            for line in header.split(b"\n"):
+                stripped = line.strip()
+                if stripped and stripped.isdigit():
+                    return int(stripped)
+
+    raise ValueError("Could not find number of faces in owner file")
+
+
+def generate_alpha_field(case_dir, output_file, ca_override=None):
+    """Generate alpha.water field file with buse filled with ink
+
+    Args:
+        case_dir: Path to case directory
+        output_file: Output file path
+        ca_override: Dict to override contact angles (for parametric studies)
+    """
+
+    mesh_dir = Path(case_dir) / "constant" / "polyMesh"
+
+    # Read contact angles from centralized parameters
+    of_params = read_parameters(Path(case_dir))
+    ca = get_contact_angles(of_params)
+
+    # Apply overrides if provided (for parametric studies)
+    if ca_override:
+        ca.update(ca_override)
+
+    print("Reading mesh info...")
+
+    # Get number of cells from owner file: max owner label + 1.
+    # The label list starts after the FoamFile block ("\n}")
+    with map_file(mesh_dir / "owner") as mm:
+        owners = parse_label_block(mm, mm.find(b"\n}"))
+    max_owner = int(owners.max()) if owners.size else -1
+
+    num_cells = max_owner + 1
+    print(f"   Found {num_cells} cells")
+
+    # Read buse zone cell labels
+    print("Reading buse cell zone...")
+    buse_cells = read_cell_zone_labels(case_dir, "buse")
+    print(f"   Found {len(buse_cells)} cells in buse zone")
+
+    # Labels index the mask directly: an out-of-range label (negative ones
+    # would wrap around) means cellZones and owner do not match
+    if buse_cells.size and (buse_cells.min() < 0 or buse_cells.max() >= num_cells):
+        raise ValueError(
+            f"cellZone 'buse': labels must be in [0, {num_cells}), "
+            f"found range [{buse_cells.min()}, {buse_cells.max()}] "
+            f"(cellZones does not match the mesh in {mesh_dir})")
+
+    # Create alpha field: 0 everywhere, 1 in buse
+    print("Setting initial conditions...")
+    print(f"   Buse cells: alpha = 1 (ink) - PRE-REMPLIE")
+    print(f"   All other cells: alpha = 0 (air)")
+    print(f"   Inlet BC: alpha = 0 (AIR qui pousse l'encre)")
+
+    # Boolean mask instead of a Python set: one byte per cell, no hashing
+    buse_mask = np.zeros(num_cells, dtype=bool)
+    buse_mask[buse_cells] = True
+
+    # Write OpenFOAM field file
+    print(f"Writing {output_file}...")
+
+    # Header/footer are formatted once; the body is written straight from
+    # the encoded array (no intermediate bytes copy)
+    fields = dict(ca, num_cells=num_cells,
+                  contact_angle_patches=format_contact_angle_patches(ca))
+    write_chunks(output_file, [
+        _HEADER_TEMPLATE.format_map(fields).encode(),
+        mask_to_ascii(buse_mask),
+        _FOOTER_TEMPLATE.format_map(fields).encode(),
+    ])
 
     print(f"Generated: {output_file}")
     print(f"   Total cells: {num_cells}")
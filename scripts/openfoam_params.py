@@ -12,12 +12,87 @@ Usage:
     rho = get_parameter(params, 'rho_ink', default=3000)
 """
 
+import functools
+import json
+import os
 import re
+import subprocess
+from collections import ChainMap
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
+OPENFOAM_BASHRC = Path("/opt/openfoam13/etc/bashrc")
+
+# Default parameters, built once at import time.
+# These should match the values in templates/system/parameters.
+_DEFAULTS = {
+    # Geometry [mm]
+    'x_puit': 0.8,
+    'x_puit_half': 0.4,
+    'y_puit': 0.128,
+    'x_plateau': 0.4,
+    'x_buse': 0.3,
+    'x_buse_half': 0.15,
+    'y_buse': 0.341,
+    'y_gap_buse': 0.070,
+    'x_gap_buse': 0.0,
+    'y_air': 0.080,
+    'x_isolant': 0.8,
+    'y_buse_bottom': 0.198,
+    'y_buse_top': 0.539,
+    'y_air_top': 0.278,
+
+    # Physics - Ink
+    'rho_ink': 3000,        # kg/m³
+    'eta_0': 0.5,           # Pa.s
+    'eta_inf': 0.167,       # Pa.s
+    'lambda': 0.15,         # s
+    'n_carreau': 0.7,       # -
+    'nu_0': 1.667e-4,       # m²/s
+    'nu_inf': 5.567e-5,     # m²/s
+    'sigma': 0.040,         # N/m
+
+    # Physics - Air
+    'rho_air': 1.2,         # kg/m³
+    'mu_air': 1e-5,         # Pa.s
+    'nu_air': 8.33e-6,      # m²/s
+
+    # Contact angles [degrees]
+    'CA_substrate': 35,
+    'CA_wall_isolant_left': 90,
+    'CA_wall_isolant_right': 90,
+    'CA_top_isolant_left': 60,
+    'CA_top_isolant_right': 60,
+    'CA_buse_int_left': 90,
+    'CA_buse_int_right': 90,
+    'CA_buse_ext_left': 180,
+    'CA_buse_ext_right': 180,
+
+    # Dispense
+    'dispense_time': 0.040,      # s (40 ms)
+    'dispense_velocity': 0.011,  # m/s
+    'dispense_end': 0.040,       # s
+
+    # Numerical
+    'endTime': 0.1,         # s
+    'writeInterval': 0.002, # s
+    'deltaT': 1e-6,         # s
+    'maxCo': 0.3,
+    'maxAlphaCo': 0.3,
+    'maxDeltaT': 1e-3,      # s
+
+    # Mesh
+    'cell_size': 5.0,       # um
+}
+_DEFAULTS_VIEW = MappingProxyType(_DEFAULTS)
+
+
+# Dictionary keys are plain words ("key value;" or "key value; // comment")
+_KEY_RE = re.compile(r'\w+', re.ASCII)
 
 
 def read_parameters(case_dir: Path = None) -> dict:
@@ -29,7 +104,7 @@ def read_parameters(case_dir: Path = None) -> dict:
                   If None, reads from templates.
 
     Returns:
-        Dictionary with all parameters
+        Dictionary with all parameters (defaults if no file found)
     """
     params_file = None
 
@@ -43,26 +118,25 @@ def read_parameters(case_dir: Path = None) -> dict:
 
     if not params_file.exists():
         print(f"Warning: parameters file not found at {params_file}")
-        return get_default_parameters()
+        return dict(get_default_parameters())
 
     params = {}
 
     with open(params_file, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    # Parse OpenFOAM dictionary format: "key value;"
-    # Handle: "key value;" and "key value; // comment"
-    pattern = r'^\s*(\w+)\s+([^;]+);'
-
     for line in content.split('\n'):
         line = line.strip()
         if not line or line.startswith('//') or line.startswith('/*'):
             continue
 
-        match = re.match(pattern, line)
-        if match:
-            key = match.group(1)
-            value_str = match.group(2).strip()
+        # Split on the first ';' and the first whitespace run instead of a
+        # backtracking regex: linear in the line length
+        head, sep, _ = line.partition(';')
+        fields = head.split(None, 1)
+        if sep and len(fields) == 2 and _KEY_RE.fullmatch(fields[0]):
+            key = fields[0]
+            value_str = fields[1].strip()
 
             # Try to convert to number
             try:
@@ -78,6 +152,138 @@ def read_parameters(case_dir: Path = None) -> dict:
     return params
 
 
+def read_text_sequential(path) -> str:
+    """
+    Read a whole text file once, hinting the kernel about the access pattern.
+
+    Large one-shot reads (run.log, polyMesh/owner, cellZones) are advised as
+    sequential before reading and dropped from the page cache afterwards, so
+    batch processing of many runs does not evict more useful pages.
+    The hints are skipped on platforms without posix_fadvise.
+
+    Args:
+        path: File to read
+
+    Returns:
+        File content
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        fd = f.fileno()
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        content = f.read()
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    return content
+
+
+def read_log_tail(path, size: int = 8192) -> bytes:
+    """
+    Read only the last `size` bytes of a (possibly huge) solver log.
+
+    The completion markers ("End", "FOAM FATAL") are written at the end of
+    the log, so there is no need to load tens of MB to find them.
+
+    Args:
+        path: Log file path
+        size: Number of bytes to read from the end
+
+    Returns:
+        Tail of the file as bytes
+    """
+    with open(path, 'rb') as f:
+        f.seek(max(0, os.fstat(f.fileno()).st_size - size))
+        return f.read()
+
+
+# Tail read by parse_solver_log: the completion markers and the last
+# "Time = " line are at the end of the log
+LOG_TAIL_SIZE = 64 * 1024
+
+
+def parse_solver_log(path, parse, size: int = LOG_TAIL_SIZE):
+    """
+    Parse a solver log from its tail, reading the whole file only if needed.
+
+    `parse` receives the text of the last `size` bytes (without the leading
+    partial line). The whole log is parsed instead only when that tail holds
+    no "Time = " line at all (e.g. a very long final step); otherwise the
+    tail's result stands, including for running cases.
+
+    Args:
+        path: Log file path
+        parse: Callable taking the log text, returning the caller's result
+        size: Number of bytes to read from the end
+
+    Returns:
+        Whatever `parse` returns
+
+    Raises:
+        FileNotFoundError: if the log does not exist
+    """
+    tail = read_log_tail(path, size)
+    if len(tail) == size:
+        if b"\nTime = " not in tail:
+            return parse(read_text_sequential(path))
+        # The tail starts mid-line: drop the partial first line
+        tail = tail[tail.find(b"\n") + 1:]
+    return parse(tail.decode('utf-8', errors='replace'))
+
+
+# Variables describing the capturing shell itself, not the OpenFOAM setup:
+# children would inherit a stale PWD since they run in their own cwd
+SHELL_STATE_VARS = frozenset({'PWD', 'OLDPWD', 'SHLVL', '_'})
+
+
+@functools.lru_cache(maxsize=None)
+def get_openfoam_env(cache_file: Path = None) -> dict:
+    """
+    Return the OpenFOAM environment, sourced once per process.
+
+    Sourcing the bashrc costs a bash process and ~100 ms; doing it once lets
+    callers run OpenFOAM tools directly with subprocess.run(args, env=...).
+    The returned dict is shared between callers and must not be modified.
+    Shell state variables (SHELL_STATE_VARS) are left out.
+
+    Args:
+        cache_file: Optional JSON file used to persist the environment across
+                    processes. It is reused as long as the bashrc has not
+                    been modified since it was written.
+
+    Raises:
+        subprocess.CalledProcessError: if the bashrc cannot be sourced
+    """
+    bashrc_mtime = None
+    if cache_file is not None:
+        try:
+            bashrc_mtime = OPENFOAM_BASHRC.stat().st_mtime_ns
+            with open(cache_file, 'rb') as f:
+                cached = json.load(f)
+            if cached.get('bashrc_mtime_ns') == bashrc_mtime:
+                return {key: value for key, value in cached['env'].items()
+                        if key not in SHELL_STATE_VARS}
+        except (OSError, ValueError, KeyError):
+            pass
+
+    out = subprocess.run(
+        ['bash', '-c', f'source {OPENFOAM_BASHRC} && env -0'],
+        check=True, capture_output=True
+    ).stdout
+    env = dict(item.split('=', 1)
+               for item in out.decode(errors='replace').split('\0') if '=' in item)
+    for key in SHELL_STATE_VARS:
+        env.pop(key, None)
+
+    if cache_file is not None and bashrc_mtime is not None:
+        try:
+            tmp = Path(cache_file).with_suffix('.tmp')
+            tmp.write_text(json.dumps({'bashrc_mtime_ns': bashrc_mtime, 'env': env}))
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass
+    return env
+
+
 def get_parameter(params: dict, key: str, default=None):
     """
     Get a parameter value with fallback to default.
@@ -93,73 +299,15 @@ def get_parameter(params: dict, key: str, default=None):
     return params.get(key, default)
 
 
-def get_default_parameters() -> dict:
+def get_default_parameters() -> Mapping:
     """
-    Return default parameters.
+    Return default parameters (read-only view, shared between calls).
     These should match the values in templates/system/parameters.
     """
-    return {
-        # Geometry [mm]
-        'x_puit': 0.8,
-        'x_puit_half': 0.4,
-        'y_puit': 0.128,
-        'x_plateau': 0.4,
-        'x_buse': 0.3,
-        'x_buse_half': 0.15,
-        'y_buse': 0.341,
-        'y_gap_buse': 0.070,
-        'x_gap_buse': 0.0,
-        'y_air': 0.080,
-        'x_isolant': 0.8,
-        'y_buse_bottom': 0.198,
-        'y_buse_top': 0.539,
-        'y_air_top': 0.278,
-
-        # Physics - Ink
-        'rho_ink': 3000,        # kg/m³
-        'eta_0': 0.5,           # Pa.s
-        'eta_inf': 0.167,       # Pa.s
-        'lambda': 0.15,         # s
-        'n_carreau': 0.7,       # -
-        'nu_0': 1.667e-4,       # m²/s
-        'nu_inf': 5.567e-5,     # m²/s
-        'sigma': 0.040,         # N/m
-
-        # Physics - Air
-        'rho_air': 1.2,         # kg/m³
-        'mu_air': 1e-5,         # Pa.s
-        'nu_air': 8.33e-6,      # m²/s
-
-        # Contact angles [degrees]
-        'CA_substrate': 35,
-        'CA_wall_isolant_left': 90,
-        'CA_wall_isolant_right': 90,
-        'CA_top_isolant_left': 60,
-        'CA_top_isolant_right': 60,
-        'CA_buse_int_left': 90,
-        'CA_buse_int_right': 90,
-        'CA_buse_ext_left': 180,
-        'CA_buse_ext_right': 180,
-
-        # Dispense
-        'dispense_time': 0.040,      # s (40 ms)
-        'dispense_velocity': 0.011,  # m/s
-        'dispense_end': 0.040,       # s
-
-        # Numerical
-        'endTime': 0.1,         # s
-        'writeInterval': 0.002, # s
-        'deltaT': 1e-6,         # s
-        'maxCo': 0.3,
-        'maxAlphaCo': 0.3,
-        'maxDeltaT': 1e-3,      # s
-
-        # Mesh
-        'cell_size': 5.0,       # um
-    }
+    return _DEFAULTS_VIEW
 
 
-def compute_derived_parameters(params: dict) -> dict:
+def compute_derived_parameters(params: Mapping) -> ChainMap:
     """
     Compute derived parameters from base parameters.
 
@@ -167,9 +315,9 @@ def compute_derived_parameters(params: dict) -> dict:
         params: Base parameters dictionary
 
     Returns:
-        Dictionary with derived parameters added
+        ChainMap with derived parameters layered over params (no copy)
     """
-    derived = params.copy()
+    derived = {}
 
     # Surface calculations [mm²]
     S_puit = params.get('x_puit', 0.8) * params.get('y_puit', 0.128)
@@ -185,7 +333,7 @@ def compute_derived_parameters(params: dict) -> dict:
     derived['nu_0_calc'] = eta_0 / rho
     derived['nu_inf_calc'] = eta_inf / rho
 
-    return derived
+    return ChainMap(derived, params)
 
 
 # Convenience functions for common parameters
@@ -12,17 +12,94 @@ Usage:
 """
 
 import argparse
+import contextlib
+import functools
+import hashlib
 import yaml
 import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 from datetime import datetime
 import json
+import logging
+import math
+from itertools import product
+from typing import NamedTuple
+
+# Loader YAML en C (libyaml) si disponible
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Sérialisation JSON: orjson si disponible (beaucoup plus rapide)
+try:
+    import orjson
+
+    def _json_dumps(obj, indent: bool = True) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    def _json_line(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    def _json_dumps(obj, indent: bool = True) -> bytes:
+        if indent:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    def _json_line(obj) -> bytes:
+        return json.dumps(obj).encode() + b"\n"
+
+class _StdoutHandler(logging.StreamHandler):
+    """Écrit sur le sys.stdout courant, comme print() (redirections comprises)."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+# Messages de progression: affichés par défaut, y compris quand StudyRunner
+# est importé depuis un autre script; seul -q (niveau WARNING) les masque
+logger = logging.getLogger('param_study')
+if not logger.handlers:
+    _handler = _StdoutHandler()
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# Progression des runs (étapes, erreurs): toujours affichée, -q ne masque
+# que le détail des paramètres modifiés
+run_logger = logging.getLogger('param_study.run')
+run_logger.setLevel(logging.INFO)
+
+
+class _RunLog(logging.LoggerAdapter):
+    """Préfixe chaque ligne des messages par le nom du run."""
+
+    def process(self, msg, kwargs):
+        prefix = f"[{self.extra['run']}] "
+        lines = str(msg).split("\n")
+        return "\n".join(prefix + line if line else line for line in lines), kwargs
+
+
+def _run_log(log, run_name: str, tagged: bool):
+    """Journal d'un run; préfixé par son nom si tagged (exécution parallèle,
+    où les messages des différents runs s'entrelacent)."""
+    return _RunLog(log, {'run': run_name}) if tagged else log
 
 # Import centralized parameters reader
-from openfoam_params import read_parameters, get_rho_ink
+from openfoam_params import read_parameters, get_rho_ink, get_openfoam_env, read_log_tail
 
 # =============================================================================
 # CONFIGURATION
@@ -33,41 +110,297 @@ CONFIG_DIR = PROJECT_ROOT / "config"
 RESULTS_DIR = PROJECT_ROOT / "results"
 LOGS_DIR = PROJECT_ROOT / "logs"
 
+# Chaîne OpenFOAM exécutée pour chaque run: (commande, fichier log).
+# Préparation (maillage + champ initial, courte et surtout I/O) puis solveur
+OPENFOAM_MESH_STAGES = [
+    (['blockMesh'], "blockMesh.log"),
+    (['setFields'], "setFields.log"),
+]
+OPENFOAM_SOLVER_STAGES = [
+    (['foamRun', '-solver', 'incompressibleVoF'], "run.log"),
+]
+OPENFOAM_STAGES = OPENFOAM_MESH_STAGES + OPENFOAM_SOLVER_STAGES
+
+# En mode parallèle, nombre max de runs préparés d'avance (en plus des runs
+# en cours). Le nombre de processus OpenFOAM simultanés reste max_workers.
+MAX_PREPARED_AHEAD = 4
+
+# Au-delà de ce nombre de runs, summary.json est écrit sans indentation
+SUMMARY_INDENT_MAX_RUNS = 200
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml_cached(path_str: str, mtime_ns: int):
+    """Parse un fichier YAML (mis en cache par chemin + date de modification)."""
+    with open(path_str, 'rb') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_study_config(study_file: Path) -> dict:
+    """Charge la config d'une étude; ne re-parse que si le fichier a changé.
+
+    Le dict retourné est partagé entre appels: ne pas le modifier.
+    """
+    return _load_yaml_cached(str(study_file), study_file.stat().st_mtime_ns)
+
+
+# =============================================================================
+# SYSTEM/PARAMETERS
+# =============================================================================
+_SIGMA_RE = re.compile(r'(sigma\s+)[^;]+(;)', re.ASCII)
+
+
+class ParametersFile:
+    """Contenu de system/parameters, analysé une seule fois.
+
+    Le fichier est découpé en segments: les valeurs numériques des lignes
+    `name   <valeur>;` sont des segments distincts, indexés par nom; tout le
+    reste (espaces, commentaires, #include...) est conservé tel quel.
+    Lire ou modifier une valeur ne re-parcourt donc pas le fichier.
+
+    Le contenu reste en bytes (syntaxe OpenFOAM ASCII): ni décodage à la
+    lecture ni ré-encodage du fichier complet à l'écriture.
+    """
+
+    _ENTRY_RE = re.compile(rb'^([A-Za-z_]\w*)\s+([0-9.eE+-]+)(?=\s*;)', re.MULTILINE)
+
+    def __init__(self, data: bytes):
+        self.parts = []  # segments du fichier, valeurs comprises
+        self.slots = {}  # nom -> indices des segments valeur dans parts
+        pos = 0
+        for match in self._ENTRY_RE.finditer(data):
+            self.parts.append(data[pos:match.start(2)])
+            self.slots.setdefault(match.group(1).decode(), []).append(len(self.parts))
+            self.parts.append(match.group(2))
+            pos = match.end(2)
+        self.parts.append(data[pos:])
+
+    def get(self, name: str):
+        """Valeur numérique de `name` (None si absent)."""
+        slots = self.slots.get(name)
+        return float(self.parts[slots[0]]) if slots else None
+
+    def set(self, name: str, value) -> int:
+        """Remplace la valeur de `name`; retourne le nombre de lignes modifiées."""
+        slots = self.slots.get(name, ())
+        for index in slots:
+            self.parts[index] = str(value).encode()
+        return len(slots)
+
+    def update(self, values: dict):
+        """Remplace plusieurs valeurs."""
+        for name, value in values.items():
+            self.set(name, value)
+
+    def render(self) -> bytes:
+        """Contenu complet du fichier."""
+        return b''.join(self.parts)
+
+
+def _atomic_write(path: Path, data):
+    """Écrit data (str ou bytes) dans path via un fichier temporaire + os.replace.
+
+    Un seul write() (buffer dimensionné sur le contenu) et un remplacement
+    atomique: un arrêt en cours d'étude ne laisse jamais de fichier tronqué.
+    """
+    tmp = f"{os.fspath(path)}.tmp"
+    mode = 'wb' if isinstance(data, bytes) else 'w'
+    with open(tmp, mode, buffering=max(8192, len(data) + 1)) as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _is_time_dir_name(name: str) -> bool:
+    """Vrai pour un nom de dossier de temps OpenFOAM ("0.005", "1e-05", ...)."""
+    try:
+        return math.isfinite(float(name))
+    except ValueError:
+        return False
+
+
+@functools.lru_cache(maxsize=None, typed=True)
+def _run_name_part(key: str, value) -> str:
+    """Fragment `<clé courte><valeur>` d'un nom de run.
+
+    Les clés et valeurs se répètent d'une combinaison à l'autre: chaque
+    fragment n'est formaté qu'une fois par sweep.
+    """
+    short_key = key.rsplit('.', 1)[-1]
+    # Formater la valeur (les flottants entiers sans ".0")
+    if isinstance(value, float) and value == int(value):
+        return f"{short_key}{int(value)}"
+    return f"{short_key}{value}"
+
+
+def _copy_trees(srcs: list, dst_dir: str):
+    """Copie plusieurs dossiers templates dans dst_dir en un seul processus.
+
+    Un unique `cp -a --reflink=auto` pour tous les dossiers (au lieu d'un
+    par dossier); shutil.copytree dossier par dossier en dernier recours.
+    """
+    try:
+        subprocess.run(['cp', '-a', '--reflink=auto', *srcs, dst_dir],
+                       check=True, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        for src in srcs:
+            dst = os.path.join(dst_dir, os.path.basename(src))
+            shutil.rmtree(dst, ignore_errors=True)
+            shutil.copytree(src, dst)
+
+
+# Modèle YAML d'une nouvelle étude (commande `create`)
+_STUDY_TEMPLATE = """# =============================================================================
+# ÉTUDE PARAMÉTRIQUE: {name}
+# =============================================================================
+name: {name}
+description: Description de l'étude
+
+base: ../base_parameters.yaml
+
+sweep:
+  parameter: rheology.eta0  # Paramètre à varier
+  values: [0.5, 1.0, 1.5, 2.0]  # Valeurs à tester
+
+outputs:
+  - spreading_diameter
+  - contact_angle_left
+  - contact_angle_right
+
+execution:
+  parallel: false
+  timeout: 3600
+
+postprocessing:
+  generate_animations: true
+  comparison_plots: true
+  export_csv: true
+"""
+
+
 # =============================================================================
 # PARAMETER MODIFIER
 # =============================================================================
+# Constantes géométriques pour ratio_surface
+S_PUIT = 0.8 * 0.128  # mm² = 0.1024 (x_puit * y_puit)
+X_BUSE = 0.3  # mm
+
+
+def _derive_buse_geometry(y_buse: float, y_buse_bottom: float) -> dict:
+    """Valeurs formatées qui dépendent de y_buse (buse remplie à 100%)."""
+    y_buse_top = y_buse_bottom + y_buse
+    y_buse_top_m = y_buse_top * 0.001  # mm to m
+    return {
+        'y_buse_top': f"{y_buse_top:.3f}",
+        'y_buse_top_m': f"{y_buse_top_m:.6f}",
+        'y_ink': f"{y_buse:.3f}",           # y_ink = y_buse
+        'y_ink_top': f"{y_buse_top:.3f}",   # y_ink_top = y_buse_top
+        'y_ink_top_m': f"{y_buse_top_m:.6f}",
+    }
+
+
 class ParameterModifier:
     """Modifie les fichiers OpenFOAM selon les paramètres YAML."""
-    
-    def __init__(self, case_dir: Path):
+
+    # Fichiers cibles (relatifs au cas)
+    PARAMETERS_FILE = Path("system") / "parameters"
+    TRANSPORT_FILE = Path("constant") / "transportProperties"
+
+    # section -> (fichier cible, méthode d'édition)
+    _DISPATCH = {
+        'surface': (TRANSPORT_FILE, '_modify_surface_tension'),
+        'rheology': (PARAMETERS_FILE, '_modify_transport_properties'),
+        'contact_angles': (PARAMETERS_FILE, '_modify_alpha_water'),
+        'numerical': (PARAMETERS_FILE, '_modify_control_dict'),
+        'process': (PARAMETERS_FILE, '_modify_process'),
+        'geometry': (PARAMETERS_FILE, '_modify_geometry'),
+    }
+
+    def __init__(self, case_dir: Path, verbose: bool = True, log_buf: list = None):
+        """
+        Args:
+            case_dir: Dossier du cas OpenFOAM
+            verbose: Afficher les modifications effectuées
+            log_buf: Si fourni, les messages y sont accumulés (une ligne par
+                     élément) au lieu d'être journalisés immédiatement
+        """
         self.case_dir = case_dir
-    
+        self.verbose = verbose
+        self.log_buf = log_buf
+
+    @functools.cached_property
+    def _rho_ink(self) -> float:
+        """Densité de l'encre du cas (system/parameters lu une seule fois)."""
+        return get_rho_ink(read_parameters(self.case_dir))
+
+    def _emit(self, msg: str):
+        """Journalise un message (ou l'accumule dans log_buf)."""
+        if self.log_buf is not None:
+            self.log_buf.append(msg)
+        else:
+            logger.info(msg)
+
     def set_parameter(self, param_path: str, value):
         """
         Modifie un paramètre dans les fichiers OpenFOAM.
-        
+
         Args:
             param_path: Chemin pointé (ex: 'rheology.eta0')
             value: Nouvelle valeur
         """
-        section, param = param_path.split('.', 1)
-        
-        if section == 'rheology':
-            self._modify_transport_properties(param, value)
-        elif section == 'contact_angles':
-            self._modify_alpha_water(param, value)
-        elif section == 'surface':
-            self._modify_surface_tension(param, value)
-        elif section == 'numerical':
-            self._modify_control_dict(param, value)
-        elif section == 'process':
-            self._modify_process(param, value)
-        elif section == 'geometry':
-            self._modify_geometry(param, value)
-        else:
-            print(f"Warning: Section '{section}' non supportée")
-    
-    def _modify_transport_properties(self, param: str, value):
+        self.set_parameters([(param_path, value)])
+
+    def set_parameters(self, assignments):
+        """
+        Modifie plusieurs paramètres en une seule passe par fichier.
+
+        Chaque fichier cible est lu une fois, toutes les substitutions sont
+        appliquées en mémoire (dans l'ordre donné), puis il est écrit une fois.
+
+        Args:
+            assignments: dict {chemin pointé: valeur} ou liste de paires
+                         (chemin pointé, valeur)
+        """
+        if isinstance(assignments, dict):
+            assignments = assignments.items()
+
+        originals = {}  # fichier relatif -> contenu lu
+        contents = {}   # fichier relatif -> contenu modifié
+
+        for param_path, value in assignments:
+            section, param = param_path.split('.', 1)
+
+            entry = self._DISPATCH.get(section)
+            if entry is None:
+                if self.verbose:
+                    self._emit(f"Warning: Section '{section}' non supportée")
+                continue
+            target, editor_name = entry
+            editor = getattr(self, editor_name)
+
+            if target not in contents:
+                file_path = self.case_dir / target
+                if not file_path.exists():
+                    if target == self.PARAMETERS_FILE:
+                        if self.verbose:
+                            self._emit(f"  ⚠ system/parameters non trouvé")
+                    continue
+                # parameters est analysé une fois (bytes); les autres fichiers
+                # restent du texte
+                if target == self.PARAMETERS_FILE:
+                    originals[target] = file_path.read_bytes()
+                    contents[target] = ParametersFile(originals[target])
+                else:
+                    originals[target] = contents[target] = file_path.read_text()
+
+            contents[target] = editor(contents[target], param, value)
+
+        # N'écrire que les fichiers réellement modifiés
+        for target, content in contents.items():
+            if isinstance(content, ParametersFile):
+                content = content.render()
+            if content != originals[target]:
+                _atomic_write(self.case_dir / target, content)
+
+    def _modify_transport_properties(self, params: ParametersFile, param: str, value) -> ParametersFile:
         """Modifie les paramètres de rhéologie dans system/parameters.
 
         Le template momentumTransport.water utilise #include et des variables
@@ -78,10 +411,8 @@ class ParameterModifier:
         - OpenFOAM attend nu0, nuInf, nu en m²/s (viscosité cinématique)
         - Conversion: nu = eta / rho (rho lu depuis system/parameters)
         """
-        import re
-
-        # Densité de l'encre (lue depuis parameters)
-        RHO_INK = get_rho_ink()
+        # Densité de l'encre (lue depuis parameters, une fois par cas)
+        RHO_INK = self._rho_ink
 
         # Mapping vers les noms de variables dans parameters
         param_map = {
@@ -92,105 +423,80 @@ class ParameterModifier:
         }
 
         if param not in param_map:
-            print(f"  ⚠ Paramètre rhéologique '{param}' non supporté")
-            return
+            if self.verbose:
+                self._emit(f"  ⚠ Paramètre rhéologique '{param}' non supporté")
+            return params
 
         eta_param, nu_param = param_map[param]
 
-        # Fichier parameters
-        params_file = self.case_dir / "system" / "parameters"
-        if not params_file.exists():
-            print(f"  ⚠ system/parameters non trouvé")
-            return
-
-        content = params_file.read_text()
-
         # Modifier la viscosité dynamique (eta)
-        pattern = rf'^({eta_param}\s+)([\d.eE+-]+)(\s*;)'
-        new_content = re.sub(pattern, rf'\g<1>{value}\3', content, flags=re.MULTILINE)
+        if params.set(eta_param, value) == 0:
+            if self.verbose:
+                self._emit(f"  ⚠ {eta_param} non trouvé dans parameters")
+            return params
 
         # Si c'est une viscosité, calculer et modifier aussi la version cinématique
         if nu_param:
             nu_value = value / RHO_INK
-            print(f"  → Conversion: η = {value} Pa·s → ν = {nu_value:.6e} m²/s (ρ = {RHO_INK} kg/m³)")
+            if self.verbose:
+                self._emit(f"  → Conversion: η = {value} Pa·s → ν = {nu_value:.6e} m²/s (ρ = {RHO_INK} kg/m³)")
 
-            pattern = rf'^({nu_param}\s+)([\d.eE+-]+)(\s*;)'
-            new_content = re.sub(pattern, rf'\g<1>{nu_value:.6e}\3', new_content, flags=re.MULTILINE)
+            params.set(nu_param, f"{nu_value:.6e}")
 
-            print(f"  ✓ {eta_param} = {value} Pa·s, {nu_param} = {nu_value:.6e} m²/s dans parameters")
+            if self.verbose:
+                self._emit(f"  ✓ {eta_param} = {value} Pa·s, {nu_param} = {nu_value:.6e} m²/s dans parameters")
         else:
-            print(f"  ✓ {eta_param} = {value} dans parameters")
+            if self.verbose:
+                self._emit(f"  ✓ {eta_param} = {value} dans parameters")
 
-        params_file.write_text(new_content)
-    
-    def _modify_alpha_water(self, surface: str, angle: float):
+        return params
+
+    def _modify_alpha_water(self, params: ParametersFile, surface: str, angle: float) -> ParametersFile:
         """Modifie system/parameters pour les angles de contact.
 
         Les angles sont definis dans parameters avec CA_<surface> et
         references dans alpha.water via $CA_<surface>.
         """
-        file_path = self.case_dir / "system" / "parameters"
-        if not file_path.exists():
-            print(f"Warning: {file_path} not found")
-            return
-
-        content = file_path.read_text()
-
         # Le parametre dans parameters est CA_<surface>
         param_name = f"CA_{surface}"
 
-        import re
-        # Pattern pour trouver CA_xxx suivi d'une valeur numerique
-        pattern = rf'^({param_name}\s+)\d+(\s*;.*?)$'
-        replacement = rf'\g<1>{int(angle)}\2'
-        new_content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
-
-        if new_content != content:
-            file_path.write_text(new_content)
-            print(f"  ✓ {param_name} = {int(angle)}° dans parameters")
+        if params.set(param_name, int(angle)):
+            if self.verbose:
+                self._emit(f"  ✓ {param_name} = {int(angle)}° dans parameters")
         else:
-            print(f"  ⚠ {param_name} non trouve dans parameters")
-    
-    def _modify_surface_tension(self, param: str, value):
-        """Modifie la tension de surface."""
-        file_path = self.case_dir / "constant" / "transportProperties"
-        if not file_path.exists():
-            return
-        
-        content = file_path.read_text()
-        import re
-        pattern = r'(sigma\s+)[^;]+(;)'
-        replacement = rf'\g<1>{value}\2'
-        new_content = re.sub(pattern, replacement, content)
-        file_path.write_text(new_content)
-        print(f"  ✓ sigma = {value} N/m")
-    
-    def _modify_control_dict(self, param: str, value):
+            if self.verbose:
+                self._emit(f"  ⚠ {param_name} non trouve dans parameters")
+        return params
+
+    def _modify_surface_tension(self, content: str, param: str, value) -> str:
+        """Modifie la tension de surface (constant/transportProperties)."""
+        # Test de sous-chaîne avant la regex: rien à faire si sigma est absent
+        new_content, n = (_SIGMA_RE.subn(rf'\g<1>{value}\2', content)
+                          if 'sigma' in content else (content, 0))
+        if n == 0:
+            if self.verbose:
+                self._emit(f"  ⚠ sigma non trouvé dans transportProperties")
+            return content
+        if self.verbose:
+            self._emit(f"  ✓ sigma = {value} N/m")
+        return new_content
+
+    def _modify_control_dict(self, params: ParametersFile, param: str, value) -> ParametersFile:
         """Modifie les parametres numeriques dans system/parameters.
 
         NOTE: controlDict utilise #include "parameters" et des variables
         comme $endTime, $writeInterval, etc. On modifie donc parameters.
         """
-        import re
-
-        params_file = self.case_dir / "system" / "parameters"
-        if not params_file.exists():
-            print(f"  ⚠ system/parameters non trouvé")
-            return
-
-        content = params_file.read_text()
-
         # Modifier le parametre dans parameters
-        pattern = rf'^({param}\s+)([\d.eE+-]+)(\s*;)'
-        new_content = re.sub(pattern, rf'\g<1>{value}\3', content, flags=re.MULTILINE)
-
-        if new_content != content:
-            params_file.write_text(new_content)
-            print(f"  ✓ {param} = {value} dans parameters")
+        if params.set(param, value):
+            if self.verbose:
+                self._emit(f"  ✓ {param} = {value} dans parameters")
         else:
-            print(f"  ⚠ {param} non trouvé dans parameters")
-    
-    def _modify_process(self, param: str, value):
+            if self.verbose:
+                self._emit(f"  ⚠ {param} non trouvé dans parameters")
+        return params
+
+    def _modify_process(self, params: ParametersFile, param: str, value) -> ParametersFile:
         """Modifie les paramètres de processus dans system/parameters.
 
         Pour dispense_time:
@@ -198,59 +504,34 @@ class ParameterModifier:
         - dispense_velocity [m/s] = y_ink [mm] * 1e-3 / dispense_time [s]
         - dispense_end [s] = dispense_time
         """
-        import re
-
         if param == 'end_time':
-            self._modify_control_dict('endTime', value)
-            return
+            return self._modify_control_dict(params, 'endTime', value)
 
-        if param == 'dispense_time':
-            params_file = self.case_dir / "system" / "parameters"
-            if not params_file.exists():
-                print(f"  ⚠ system/parameters non trouvé")
-                return
+        if param != 'dispense_time':
+            return params
 
-            content = params_file.read_text()
+        # Lire y_ink depuis le fichier
+        y_ink = params.get('y_ink')  # en mm
+        if y_ink is None:
+            if self.verbose:
+                self._emit(f"  ⚠ y_ink non trouvé dans parameters")
+            return params
 
-            # Lire y_ink depuis le fichier
-            match = re.search(r'^y_ink\s+([\d.eE+-]+)\s*;', content, re.MULTILINE)
-            if not match:
-                print(f"  ⚠ y_ink non trouvé dans parameters")
-                return
+        # Calculer la vitesse: v = y_ink [mm] * 1e-3 / dispense_time [s]
+        dispense_velocity = y_ink * 0.001 / value  # m/s
 
-            y_ink = float(match.group(1))  # en mm
-
-            # Calculer la vitesse: v = y_ink [mm] * 1e-3 / dispense_time [s]
-            dispense_velocity = y_ink * 0.001 / value  # m/s
-
-            # Mettre à jour dispense_time
-            new_content = re.sub(
-                r'^(dispense_time\s+)([\d.eE+-]+)(\s*;)',
-                rf'\g<1>{value}\3',
-                content,
-                flags=re.MULTILINE
-            )
-
-            # Mettre à jour dispense_velocity
-            new_content = re.sub(
-                r'^(dispense_velocity\s+)([\d.eE+-]+)(\s*;)',
-                rf'\g<1>{dispense_velocity:.6f}\3',
-                new_content,
-                flags=re.MULTILINE
-            )
-
-            # Mettre à jour dispense_end = dispense_time
-            new_content = re.sub(
-                r'^(dispense_end\s+)([\d.eE+-]+)(\s*;)',
-                rf'\g<1>{value}\3',
-                new_content,
-                flags=re.MULTILINE
-            )
-
-            params_file.write_text(new_content)
-            print(f"  ✓ dispense_time = {value*1000:.0f} ms → velocity = {dispense_velocity*1000:.2f} mm/s (y_ink = {y_ink} mm)")
-
-    def _modify_geometry(self, param: str, value):
+        # dispense_time, dispense_velocity et dispense_end = dispense_time
+        params.update({
+            'dispense_time': value,
+            'dispense_velocity': f"{dispense_velocity:.6f}",
+            'dispense_end': value,
+        })
+
+        if self.verbose:
+            self._emit(f"  ✓ dispense_time = {value*1000:.0f} ms → velocity = {dispense_velocity*1000:.2f} mm/s (y_ink = {y_ink} mm)")
+        return params
+
+    def _modify_geometry(self, params: ParametersFile, param: str, value) -> ParametersFile:
         """Modifie les paramètres géométriques dans system/parameters.
 
         Quand on modifie y_buse, on doit aussi recalculer:
@@ -264,156 +545,59 @@ class ParameterModifier:
         - S_puit = x_puit * y_puit = 0.8 * 0.128 = 0.1024 mm²
         - y_buse = ratio * S_puit / x_buse
         """
-        import re
-
-        params_file = self.case_dir / "system" / "parameters"
-        if not params_file.exists():
-            print(f"  ⚠ system/parameters non trouvé")
-            return
-
-        content = params_file.read_text()
-
         # Cas spécial: ratio_surface → calculer y_buse
         if param == 'ratio_surface':
-            # Constantes géométriques
-            S_PUIT = 0.8 * 0.128  # mm² = 0.1024
-            X_BUSE = 0.3  # mm
-
             y_buse = value * S_PUIT / X_BUSE
-            print(f"  → ratio_surface = {value} → y_buse = {y_buse:.3f} mm")
-
-            # Modifier ratio_surface
-            new_content = re.sub(
-                r'^(ratio_surface\s+)([\d.eE+-]+)(\s*;)',
-                rf'\g<1>{value}\3',
-                content,
-                flags=re.MULTILINE
-            )
-
-            # Modifier y_buse et dérivées
-            new_content = re.sub(
-                r'^(y_buse\s+)([\d.eE+-]+)(\s*;)',
-                rf'\g<1>{y_buse:.3f}\3',
-                new_content,
-                flags=re.MULTILINE
-            )
+            if self.verbose:
+                self._emit(f"  → ratio_surface = {value} → y_buse = {y_buse:.3f} mm")
 
-            # Lire y_buse_bottom pour calculer les positions
-            match = re.search(r'^y_buse_bottom\s+([\d.eE+-]+)\s*;', new_content, re.MULTILINE)
-            if match:
-                y_buse_bottom = float(match.group(1))
-                y_buse_top = y_buse_bottom + y_buse
-                y_buse_top_m = y_buse_top * 0.001
-
-                # y_buse_top
-                new_content = re.sub(
-                    r'^(y_buse_top\s+)([\d.eE+-]+)(\s*;)',
-                    rf'\g<1>{y_buse_top:.3f}\3',
-                    new_content,
-                    flags=re.MULTILINE
-                )
-                # y_buse_top_m
-                new_content = re.sub(
-                    r'^(y_buse_top_m\s+)([\d.eE+-]+)(\s*;)',
-                    rf'\g<1>{y_buse_top_m:.6f}\3',
-                    new_content,
-                    flags=re.MULTILINE
-                )
-                # y_ink = y_buse (100% remplie)
-                new_content = re.sub(
-                    r'^(y_ink\s+)([\d.eE+-]+)(\s*;)',
-                    rf'\g<1>{y_buse:.3f}\3',
-                    new_content,
-                    flags=re.MULTILINE
-                )
-                # y_ink_top = y_buse_top
-                new_content = re.sub(
-                    r'^(y_ink_top\s+)([\d.eE+-]+)(\s*;)',
-                    rf'\g<1>{y_buse_top:.3f}\3',
-                    new_content,
-                    flags=re.MULTILINE
-                )
-                # y_ink_top_m = y_buse_top_m
-                new_content = re.sub(
-                    r'^(y_ink_top_m\s+)([\d.eE+-]+)(\s*;)',
-                    rf'\g<1>{y_buse_top_m:.6f}\3',
-                    new_content,
-                    flags=re.MULTILINE
-                )
-
-                print(f"  ✓ ratio={value} → y_buse={y_buse:.3f}mm, y_ink={y_buse:.3f}mm, y_buse_top={y_buse_top:.3f}mm")
-
-            params_file.write_text(new_content)
-            return
+            updates = {'ratio_surface': value, 'y_buse': f"{y_buse:.3f}"}
 
-        # Modifier le paramètre demandé (capture uniquement la valeur numérique)
-        pattern = rf'(^{param}\s+)([\d.eE+-]+)(\s*;)'
-        new_content = re.sub(pattern, rf'\g<1>{value}\3', content, flags=re.MULTILINE)
-
-        # Si c'est y_buse, recalculer les valeurs dérivées
-        if param == 'y_buse':
-            # Lire y_buse_bottom depuis le fichier (valeur numérique uniquement)
-            match = re.search(r'^y_buse_bottom\s+([\d.eE+-]+)\s*;', new_content, re.MULTILINE)
-            if match:
-                y_buse_bottom = float(match.group(1))
-                y_buse_top = y_buse_bottom + value
-                y_buse_top_m = y_buse_top * 0.001  # mm to m
-
-                # Mettre à jour y_buse_top
-                new_content = re.sub(
-                    r'^(y_buse_top\s+)([\d.eE+-]+)(\s*;)',
-                    rf'\g<1>{y_buse_top:.3f}\3',
-                    new_content,
-                    flags=re.MULTILINE
-                )
-
-                # Mettre à jour y_buse_top_m
-                new_content = re.sub(
-                    r'^(y_buse_top_m\s+)([\d.eE+-]+)(\s*;)',
-                    rf'\g<1>{y_buse_top_m:.6f}\3',
-                    new_content,
-                    flags=re.MULTILINE
-                )
-
-                # Mettre à jour y_ink = y_buse (100% remplie)
-                new_content = re.sub(
-                    r'^(y_ink\s+)([\d.eE+-]+)(\s*;)',
-                    rf'\g<1>{value:.3f}\3',
-                    new_content,
-                    flags=re.MULTILINE
-                )
-                # y_ink_top = y_buse_top
-                new_content = re.sub(
-                    r'^(y_ink_top\s+)([\d.eE+-]+)(\s*;)',
-                    rf'\g<1>{y_buse_top:.3f}\3',
-                    new_content,
-                    flags=re.MULTILINE
-                )
-                # y_ink_top_m = y_buse_top_m
-                new_content = re.sub(
-                    r'^(y_ink_top_m\s+)([\d.eE+-]+)(\s*;)',
-                    rf'\g<1>{y_buse_top_m:.6f}\3',
-                    new_content,
-                    flags=re.MULTILINE
-                )
-
-                print(f"  ✓ y_buse = {value} mm → y_buse_top = {y_buse_top:.3f} mm, y_ink = {value} mm")
+            # Lire y_buse_bottom pour calculer les positions
+            y_buse_bottom = params.get('y_buse_bottom')
+            if y_buse_bottom is not None:
+                derived = _derive_buse_geometry(y_buse, y_buse_bottom)
+                updates.update(derived)
+                if self.verbose:
+                    self._emit(f"  ✓ ratio={value} → y_buse={y_buse:.3f}mm, y_ink={y_buse:.3f}mm, y_buse_top={derived['y_buse_top']}mm")
+
+            params.update(updates)
+
+        elif param == 'y_buse':
+            params.set('y_buse', value)
+
+            # Recalculer les valeurs dérivées depuis y_buse_bottom
+            y_buse_bottom = params.get('y_buse_bottom')
+            if y_buse_bottom is not None:
+                derived = _derive_buse_geometry(value, y_buse_bottom)
+                params.update(derived)
+                if self.verbose:
+                    self._emit(f"  ✓ y_buse = {value} mm → y_buse_top = {derived['y_buse_top']} mm, y_ink = {value} mm")
             else:
-                print(f"  ✓ y_buse = {value} mm (y_buse_bottom non trouvé, dérivées non calculées)")
+                if self.verbose:
+                    self._emit(f"  ✓ y_buse = {value} mm (y_buse_bottom non trouvé, dérivées non calculées)")
+
         elif param == 'x_gap_buse':
             # Mettre à jour x_gap_buse_m aussi
             x_gap_buse_m = value * 0.001  # mm to m
-            new_content = re.sub(
-                r'^(x_gap_buse_m\s+)([\d.eE+-]+)(\s*;)',
-                rf'\g<1>{x_gap_buse_m:.6f}\3',
-                new_content,
-                flags=re.MULTILINE
-            )
-            print(f"  ✓ x_gap_buse = {value} mm → x_gap_buse_m = {x_gap_buse_m:.6f} m")
+            params.update({'x_gap_buse': value, 'x_gap_buse_m': f"{x_gap_buse_m:.6f}"})
+            if self.verbose:
+                self._emit(f"  ✓ x_gap_buse = {value} mm → x_gap_buse_m = {x_gap_buse_m:.6f} m")
+
         else:
-            print(f"  ✓ {param} = {value} dans parameters")
+            # Modifier le paramètre demandé (capture uniquement la valeur numérique)
+            params.set(param, value)
+            if self.verbose:
+                self._emit(f"  ✓ {param} = {value} dans parameters")
+
+        return params
+
 
-        params_file.write_text(new_content)
+class PreparedCase(NamedTuple):
+    """Résultat de StudyRunner._prepare_case."""
+    entry: dict          # entrée de résumé (status None tant que le solveur reste à lancer)
+    run_dir: Path
+    remaining: float     # temps restant pour le solveur; None si l'entrée est définitive
 
 
 # =============================================================================
@@ -422,8 +606,135 @@ class ParameterModifier:
 class StudyRunner:
     """Gestionnaire d'études paramétriques."""
     
+    # Fichiers modifiés par ParameterModifier ou réécrits sur place par
+    # setFields: ce sont les seuls à restaurer quand un dossier de run est réutilisé
+    RESET_FILES = (
+        Path("0") / "alpha.water",
+        Path("system") / "parameters",
+        Path("constant") / "transportProperties",
+    )
+    # Sorties OpenFOAM/post-traitement supprimées avant réutilisation
+    # (en plus des dossiers de temps et processor*)
+    OUTPUT_DIRS = {"VTK", "postProcessing", "dynamicCode"}
+    # Animations/images d'un run (suffixe -> dossier de l'étude): dans le
+    # dossier du run et sous <étude>/gifs, <étude>/png (nommées d'après le
+    # run). Supprimées quand le run est relancé
+    MEDIA_DIRS = {".gif": "gifs", ".png": "png"}
+    TEMPLATE_STAMP = ".template_stamp"
+    # Empreinte des paramètres appliqués au dossier (relance à l'identique)
+    CASE_STAMP = ".case_stamp"
+    # Fichiers écrits par ParameterModifier: conservés si l'empreinte correspond
+    PARAMETER_FILES = {os.fspath(Path("system") / "parameters"),
+                       os.fspath(Path("constant") / "transportProperties")}
+    # Chemins (str) des sous-dossiers templates, calculés une fois
+    TEMPLATE_SOURCES = {sub: os.fspath(TEMPLATES_DIR / sub) for sub in ("0", "constant", "system")}
+
     def __init__(self):
         self.ensure_dirs()
+
+    @functools.cached_property
+    def _template_bytes(self) -> dict:
+        """Contenu des templates pour RESET_FILES (lu une seule fois)."""
+        return {os.fspath(rel): (TEMPLATES_DIR / rel).read_bytes() for rel in self.RESET_FILES}
+
+    @functools.cached_property
+    def _template_stamp(self) -> str:
+        """Empreinte (chemin, taille, mtime) des templates.
+
+        Un dossier de run n'est réutilisé que si les templates n'ont pas
+        changé depuis sa création. La première ligne identifie le mode de
+        clonage: les dossiers dont system/ était lié au template (anciennes
+        versions) ne sont pas réutilisés.
+        """
+        entries = []
+        for root, _, files in os.walk(TEMPLATES_DIR):
+            for name in files:
+                path = os.path.join(root, name)
+                st = os.stat(path)
+                rel = os.path.relpath(path, TEMPLATES_DIR)
+                entries.append(f"{rel}:{st.st_size}:{st.st_mtime_ns}")
+        return "\n".join(["clone:copy"] + sorted(entries))
+
+    @staticmethod
+    def _case_hash(assignments: list) -> str:
+        """Empreinte des affectations (ordre compris: un override l'emporte)."""
+        data = json.dumps(assignments, default=str).encode()
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _prepare_run_dir(self, run_dir: Path, case_hash: str = None) -> bool:
+        """Crée le dossier de run depuis les templates, ou le réinitialise.
+
+        Si le dossier existe déjà (relance) et provient des mêmes templates,
+        on supprime seulement les sorties OpenFOAM et on restaure les
+        quelques fichiers modifiés, au lieu de rmtree + copie complète.
+
+        Returns:
+            True si le dossier porte déjà les paramètres de case_hash: les
+            fichiers de paramètres sont conservés tels quels et
+            set_parameters peut être sauté.
+        """
+        run_path = os.fspath(run_dir)
+        stamp_file = os.path.join(run_path, self.TEMPLATE_STAMP)
+        case_stamp_file = os.path.join(run_path, self.CASE_STAMP)
+        try:
+            with open(stamp_file) as f:
+                reusable = f.read() == self._template_stamp
+        except FileNotFoundError:
+            reusable = False
+
+        # Les images de l'ancien run seraient prises pour celles du nouveau
+        study_path, run_name = os.path.split(run_path)
+        for suffix, media_dir in self.MEDIA_DIRS.items():
+            try:
+                os.unlink(os.path.join(study_path, media_dir, run_name + suffix))
+            except FileNotFoundError:
+                pass
+
+        if reusable:
+            with os.scandir(run_path) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        if entry.name.endswith(tuple(self.MEDIA_DIRS)):
+                            os.unlink(entry.path)
+                        continue
+                    if entry.name == "0":
+                        continue
+                    if (entry.name in self.OUTPUT_DIRS or entry.name.startswith("processor")
+                            or _is_time_dir_name(entry.name)):
+                        shutil.rmtree(entry.path)
+
+            staged = False
+            try:
+                with open(case_stamp_file) as f:
+                    staged = case_hash is not None and f.read() == case_hash
+            except FileNotFoundError:
+                pass
+            if not staged:
+                # Les paramètres vont changer: l'empreinte n'est plus valable
+                # (réécrite par l'appelant une fois les fichiers modifiés)
+                try:
+                    os.unlink(case_stamp_file)
+                except FileNotFoundError:
+                    pass
+
+            for rel, data in self._template_bytes.items():
+                if staged and rel in self.PARAMETER_FILES:
+                    continue
+                _atomic_write(os.path.join(run_path, rel), data)
+            return staged
+
+        if os.path.exists(run_path):
+            shutil.rmtree(run_path)
+
+        # Copie (reflink si possible) de 0/, constant/ et system/. Pas de
+        # liens physiques: une édition sur place dans un run (setFields,
+        # foamDictionary -set, éditeur) modifierait le template et tous les runs
+        os.makedirs(run_path)
+        src = self.TEMPLATE_SOURCES
+        _copy_trees([src["0"], src["constant"], src["system"]], run_path)
+        with open(stamp_file, "w") as f:
+            f.write(self._template_stamp)
+        return False
     
     def ensure_dirs(self):
         """Crée les dossiers nécessaires."""
@@ -443,9 +754,8 @@ class StudyRunner:
             return
         
         for study_file in sorted(studies):
-            with open(study_file) as f:
-                config = yaml.safe_load(f)
-            
+            config = load_study_config(study_file)
+
             name = config.get('name', study_file.stem)
             desc = config.get('description', 'Pas de description')
             sweep = config.get('sweep', {})
@@ -471,84 +781,227 @@ class StudyRunner:
             print(f"❌ L'étude '{name}' existe déjà: {study_file}")
             return
         
-        template = f"""# =============================================================================
-# ÉTUDE PARAMÉTRIQUE: {name}
-# =============================================================================
-name: {name}
-description: Description de l'étude
-
-base: ../base_parameters.yaml
-
-sweep:
-  parameter: rheology.eta0  # Paramètre à varier
-  values: [0.5, 1.0, 1.5, 2.0]  # Valeurs à tester
-
-outputs:
-  - spreading_diameter
-  - contact_angle_left
-  - contact_angle_right
-
-execution:
-  parallel: false
-  timeout: 3600
-
-postprocessing:
-  generate_animations: true
-  comparison_plots: true
-  export_csv: true
-"""
-        study_file.write_text(template)
+        _atomic_write(study_file, _STUDY_TEMPLATE.format(name=name))
         print(f"✅ Étude créée: {study_file}")
         print(f"   Éditez ce fichier pour configurer votre étude.")
     
-    def _generate_grid_combinations(self, parameters: list) -> list:
+    def _generate_grid_combinations(self, parameters: list):
         """Génère toutes les combinaisons pour un grid sweep.
 
         Args:
             parameters: Liste de dicts avec 'name' et 'values'
 
-        Returns:
-            Liste de dicts avec toutes les combinaisons
+        Yields:
+            Un dict par combinaison (générées à la demande)
         """
-        from itertools import product
-
         # Extraire les noms et valeurs
         names = [p['name'] for p in parameters]
         value_lists = [p['values'] for p in parameters]
 
-        # Générer toutes les combinaisons
-        combinations = []
         for combo in product(*value_lists):
-            combinations.append(dict(zip(names, combo)))
-
-        return combinations
+            yield dict(zip(names, combo))
 
     def _make_run_name(self, index: int, params: dict) -> str:
         """Crée un nom de run lisible à partir des paramètres."""
-        parts = [f"run_{index:03d}"]
-        for key, value in params.items():
-            short_key = key.split('.')[-1]
-            # Formater la valeur
-            if isinstance(value, float):
-                if value == int(value):
-                    val_str = str(int(value))
-                else:
-                    val_str = str(value)
-            else:
-                val_str = str(value)
-            parts.append(f"{short_key}{val_str}")
-        return "_".join(parts)
+        return "_".join([f"run_{index:03d}"]
+                        + [_run_name_part(key, value) for key, value in params.items()])
+
+    def _run_stages(self, run_dir: Path, stages: list, timeout: float, slots=None,
+                    log=run_logger):
+        """Lance des étapes OpenFOAM à la suite, sans bash, avec
+        l'environnement OpenFOAM mis en cache.
+
+        Args:
+            slots: Sémaphore optionnel tenu pendant les étapes (borne le
+                   nombre de processus OpenFOAM simultanés); l'attente d'un
+                   slot n'est pas décomptée du timeout
+            log: Journal des erreurs (préfixé par le nom du run en parallèle)
+
+        Returns:
+            (status, temps écoulé): status None si toutes les étapes ont
+            réussi, sinon "ERROR", "TIMEOUT" ou "EXCEPTION"
+        """
+        with slots if slots is not None else contextlib.nullcontext():
+            start = time.monotonic()
+            try:
+                env = get_openfoam_env(LOGS_DIR / '.of_env.json')
+                deadline = start + timeout
+                for args, log_name in stages:
+                    with open(run_dir / log_name, 'wb') as log_file:
+                        result = subprocess.run(
+                            args,
+                            cwd=run_dir,
+                            env=env,
+                            stdout=log_file,
+                            stderr=subprocess.STDOUT,
+                            timeout=max(0, deadline - time.monotonic())
+                        )
+                    if result.returncode != 0:
+                        log.error(f"  ❌ Erreur (code {result.returncode})")
+                        return "ERROR", time.monotonic() - start
+
+            except subprocess.TimeoutExpired:
+                log.error(f"  ⏱️ Timeout")
+                return "TIMEOUT", time.monotonic() - start
+            except Exception as e:
+                log.error(f"  ❌ Exception: {e}")
+                return "EXCEPTION", time.monotonic() - start
+
+            return None, time.monotonic() - start
+
+    def _prepare_case(self, i: int, params: dict, study_results: Path, config: dict,
+                      last_index: int, dry_run: bool, slots=None,
+                      tagged: bool = False) -> PreparedCase:
+        """Étape 1: dossier de run, paramètres, blockMesh et setFields.
+
+        Le temps restant du PreparedCase vaut None quand l'entrée est
+        définitive (dry run ou échec de la préparation): le solveur n'est
+        alors pas lancé. Avec tagged, chaque message est préfixé par le
+        nom du run.
+        """
+        run_name = self._make_run_name(i, params)
+        run_dir = study_results / run_name
+        log = _run_log(run_logger, run_name, tagged)
+
+        log.info(f"\n--- Simulation {i}/{last_index} ---")
+        for key, val in params.items():
+            log.info(f"  {key} = {val}")
+
+        if dry_run:
+            log.info(f"  [DRY RUN] Créerait: {run_dir}")
+            return PreparedCase({
+                'run': run_name,
+                'parameters': params,
+                'status': 'DRY_RUN'
+            }, run_dir, None)
+
+        # TOUS les paramètres du sweep, puis les overrides
+        # (end_time, writeInterval, etc.)
+        assignments = list(params.items())
+        overrides = config.get('overrides', {})
+        for section, section_params in overrides.items():
+            for param, value in section_params.items():
+                full_path = f"{section}.{param}"
+                log.info(f"  [override] {full_path} = {value}")
+                assignments.append((full_path, value))
+        case_hash = self._case_hash(assignments)
+
+        # Copier les templates (ou réinitialiser un dossier existant)
+        if self._prepare_run_dir(run_dir, case_hash):
+            log.info(f"  Paramètres déjà appliqués (relance à l'identique)")
+        else:
+            # Modifier les paramètres en une passe par fichier; messages
+            # du modifier regroupés en un seul enregistrement par run
+            log_buf = []
+            ParameterModifier(run_dir, verbose=logger.isEnabledFor(logging.INFO),
+                              log_buf=log_buf).set_parameters(assignments)
+            if log_buf:
+                _run_log(logger, run_name, tagged).info("\n".join(log_buf))
+            _atomic_write(run_dir / self.CASE_STAMP, case_hash)
+
+        # Lancer la simulation
+        log.info(f"  Génération maillage (blockMesh)...")
+        log.info(f"  Initialisation champ alpha (setFields)...")
+
+        # Le timeout couvre l'ensemble de la chaîne, comme avant: le solveur
+        # dispose de ce que la préparation n'a pas consommé
+        timeout = config.get('execution', {}).get('timeout', 3600)
+        status, elapsed = self._run_stages(run_dir, OPENFOAM_MESH_STAGES, timeout, slots, log)
+
+        entry = {
+            'run': run_name,
+            'parameters': params,
+            'status': status
+        }
+        return PreparedCase(entry, run_dir, timeout - elapsed if status is None else None)
+
+    def _solve_case(self, case: PreparedCase, slots=None, tagged: bool = False) -> dict:
+        """Étape 2: solveur (foamRun) sur un dossier préparé; complète l'entrée."""
+        log = _run_log(run_logger, case.run_dir.name, tagged)
+        status, _ = self._run_stages(case.run_dir, OPENFOAM_SOLVER_STAGES, case.remaining,
+                                     slots, log)
+        if status is None:
+            log.info(f"  ✅ Simulation terminée")
+            status = "OK"
+        case.entry['status'] = status
+        return case.entry
+
+    def _run_one(self, i: int, params: dict, study_results: Path, config: dict,
+                 last_index: int, dry_run: bool) -> dict:
+        """Prépare et exécute une simulation; retourne son entrée de résumé."""
+        case = self._prepare_case(i, params, study_results, config, last_index, dry_run)
+        if case.remaining is None:
+            return case.entry
+        return self._solve_case(case)
+
+    def _run_pipelined(self, run_jobs, max_workers: int, summary_jsonl) -> list:
+        """Exécute les runs en deux étages: préparation puis solveur.
+
+        Au plus max_workers processus OpenFOAM (blockMesh, setFields ou
+        foamRun) tournent à la fois: chaque étage tient un slot du même
+        sémaphore pendant ses processus. Jusqu'à MAX_PREPARED_AHEAD runs
+        sont préparés d'avance (dossier, paramètres, maillage), de sorte
+        qu'un solveur démarre dès qu'un slot se libère. Chaque entrée est
+        ajoutée à summary.jsonl dès qu'elle est définitive.
+
+        Returns:
+            Les entrées de résumé, dans l'ordre des runs
+        """
+        slots = threading.BoundedSemaphore(max_workers)
+        max_cases = max_workers + min(max_workers, MAX_PREPARED_AHEAD)
+        numbered_jobs = enumerate(run_jobs)
+        results = {}
+        steps = {}  # future -> (index du run, étage)
+        pending = set()
+        with ThreadPoolExecutor(max_workers=max_cases) as executor:
+            while True:
+                # Anticipation bornée: un futur en attente par run en cours
+                while len(pending) < max_cases:
+                    job = next(numbered_jobs, None)
+                    if job is None:
+                        break
+                    k, args = job
+                    future = executor.submit(self._prepare_case, *args,
+                                             slots=slots, tagged=True)
+                    steps[future] = (k, 'prepare')
+                    pending.add(future)
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    k, step = steps.pop(future)
+                    if step == 'prepare':
+                        case = future.result()
+                        if case.remaining is not None:
+                            solver_future = executor.submit(self._solve_case, case,
+                                                           slots=slots, tagged=True)
+                            steps[solver_future] = (k, 'solve')
+                            pending.add(solver_future)
+                            continue
+                        entry = case.entry
+                    else:
+                        entry = future.result()
+                    results[k] = entry
+                    summary_jsonl.write(_json_line(entry))
+        return [results[k] for k in range(len(results))]
+
+    def run_study(self, study_name: str, dry_run: bool = False, jobs: int = None):
+        """Exécute une étude paramétrique (simple ou grid).
 
-    def run_study(self, study_name: str, dry_run: bool = False):
-        """Exécute une étude paramétrique (simple ou grid)."""
+        Args:
+            study_name: Nom du fichier d'étude (sans .yaml)
+            dry_run: Affiche les runs sans les exécuter
+            jobs: Nombre de simulations simultanées; remplace la section
+                  `execution` de l'étude si fourni
+        """
         study_file = CONFIG_DIR / "studies" / f"{study_name}.yaml"
 
         if not study_file.exists():
             print(f"❌ Étude non trouvée: {study_file}")
             return
 
-        with open(study_file) as f:
-            config = yaml.safe_load(f)
+        config = load_study_config(study_file)
 
         sweep = config.get('sweep', {})
         sweep_type = config.get('sweep_type', 'simple')
@@ -563,6 +1016,7 @@ postprocessing:
                 return
 
             combinations = self._generate_grid_combinations(parameters)
+            n_runs = math.prod(len(p['values']) for p in parameters)
             param_names = [p['name'] for p in parameters]
 
             print(f"\n=== ÉTUDE GRID: {study_name} ===")
@@ -570,9 +1024,9 @@ postprocessing:
             print(f"Paramètres: {param_names}")
             for p in parameters:
                 print(f"  - {p['name']}: {p['values']}")
-            print(f"Combinaisons: {len(combinations)}")
+            print(f"Combinaisons: {n_runs}")
             if start_index > 1:
-                print(f"Index début: {start_index} (run_{start_index:03d} à run_{start_index + len(combinations) - 1:03d})")
+                print(f"Index début: {start_index} (run_{start_index:03d} à run_{start_index + n_runs - 1:03d})")
 
         else:
             # Simple sweep (rétrocompatibilité)
@@ -583,14 +1037,15 @@ postprocessing:
                 print("❌ Configuration sweep invalide")
                 return
 
-            combinations = [{param_path: v} for v in values]
+            combinations = ({param_path: v} for v in values)
+            n_runs = len(values)
             param_names = [param_path]
 
             print(f"\n=== ÉTUDE: {study_name} ===")
             print(f"Paramètre: {param_path}")
             print(f"Valeurs: {values}")
 
-        print(f"Simulations: {len(combinations)}")
+        print(f"Simulations: {n_runs}")
         print()
 
         # Créer dossier résultats pour cette étude
@@ -602,85 +1057,48 @@ postprocessing:
         # Sauvegarder la config
         shutil.copy(study_file, study_results / "study_config.yaml")
 
-        results_summary = []
-
-        for i, params in enumerate(combinations, start_index):
-            run_name = self._make_run_name(i, params)
-            run_dir = study_results / run_name
-
-            print(f"\n--- Simulation {i}/{start_index + len(combinations) - 1} ---")
-            for key, val in params.items():
-                print(f"  {key} = {val}")
-
-            if dry_run:
-                print(f"  [DRY RUN] Créerait: {run_dir}")
-                results_summary.append({
-                    'run': run_name,
-                    'parameters': params,
-                    'status': 'DRY_RUN'
-                })
-                continue
-
-            # Copier les templates
-            if run_dir.exists():
-                shutil.rmtree(run_dir)
-
-            shutil.copytree(TEMPLATES_DIR / "0", run_dir / "0")
-            shutil.copytree(TEMPLATES_DIR / "constant", run_dir / "constant")
-            shutil.copytree(TEMPLATES_DIR / "system", run_dir / "system")
-
-            # Modifier TOUS les paramètres du sweep
-            modifier = ParameterModifier(run_dir)
-            for param_path, value in params.items():
-                modifier.set_parameter(param_path, value)
-
-            # Appliquer les overrides (end_time, writeInterval, etc.)
-            overrides = config.get('overrides', {})
-            for section, section_params in overrides.items():
-                for param, value in section_params.items():
-                    full_path = f"{section}.{param}"
-                    print(f"  [override] {full_path} = {value}")
-                    modifier.set_parameter(full_path, value)
-
-            # Lancer la simulation
-            print(f"  Génération maillage (blockMesh)...")
-            print(f"  Initialisation champ alpha (setFields)...")
-            log_file = run_dir / "run.log"
-
-            try:
-                # Source OpenFOAM, blockMesh (regénère le maillage), setFields puis foamRun
-                cmd = f"source /opt/openfoam13/etc/bashrc && cd {run_dir} && blockMesh > blockMesh.log 2>&1 && setFields > setFields.log 2>&1 && foamRun -solver incompressibleVoF > run.log 2>&1"
-                result = subprocess.run(
-                    cmd,
-                    shell=True,
-                    executable='/bin/bash',
-                    timeout=config.get('execution', {}).get('timeout', 3600)
-                )
-
-                if result.returncode == 0:
-                    print(f"  ✅ Simulation terminée")
-                    status = "OK"
-                else:
-                    print(f"  ❌ Erreur (code {result.returncode})")
-                    status = "ERROR"
-
-            except subprocess.TimeoutExpired:
-                print(f"  ⏱️ Timeout")
-                status = "TIMEOUT"
-            except Exception as e:
-                print(f"  ❌ Exception: {e}")
-                status = "EXCEPTION"
-
-            results_summary.append({
-                'run': run_name,
-                'parameters': params,
-                'status': status
-            })
+        last_index = start_index + n_runs - 1
+        execution = config.get('execution', {})
+
+        # Les runs sont indépendants (un dossier chacun): en mode parallèle,
+        # des threads suffisent puisque le travail est dans subprocess.run.
+        # Nombre de workers: max_parallel (ou parallel_jobs), sinon nb de CPU
+        # (--jobs en ligne de commande prioritaire)
+        max_workers = 1
+        if jobs is not None:
+            max_workers = max(1, min(n_runs, jobs))
+        elif execution.get('parallel'):
+            max_workers = min(n_runs,
+                              execution.get('max_parallel') or execution.get('parallel_jobs')
+                              or os.cpu_count() or 1)
+        if dry_run:
+            max_workers = 1
+
+        run_jobs = ((i, params, study_results, config, last_index, dry_run)
+                    for i, params in enumerate(combinations, start_index))
+
+        # summary.jsonl: une ligne par run, ajoutée dès que le run se termine
+        # (étude interrompue -> résultats conservés, status consultable en cours).
+        # Repart à zéro à chaque lancement; un dry run écrit dans un fichier à
+        # part pour ne jamais masquer les résultats réels
+        jsonl_name = "summary_dry_run.jsonl" if dry_run else "summary.jsonl"
+        with open(study_results / jsonl_name, "wb", buffering=0) as summary_jsonl:
+            if max_workers > 1:
+                print(f"Exécution parallèle: {max_workers} simulations simultanées")
+                results_summary = self._run_pipelined(run_jobs, max_workers, summary_jsonl)
+            else:
+                results_summary = []
+                for job in run_jobs:
+                    entry = self._run_one(*job)
+                    summary_jsonl.write(_json_line(entry))
+                    results_summary.append(entry)
 
-        # Sauvegarder le résumé
+        # Sauvegarder le résumé complet
         summary_file = study_results / "summary.json"
-        with open(summary_file, 'w') as f:
-            json.dump(results_summary, f, indent=2)
+        # Indenté pour les études de taille courante, compact au-delà
+        # (summary.jsonl reste lisible ligne à ligne)
+        summary_file.write_bytes(_json_dumps(
+            results_summary, indent=len(results_summary) <= SUMMARY_INDENT_MAX_RUNS))
 
         print(f"\n=== ÉTUDE TERMINÉE ===")
         print(f"Résultats: {study_results}")
@@ -694,32 +1112,49 @@ postprocessing:
             print(f"❌ Aucun résultat pour '{study_name}'")
             return
         
+        # Résultats connus: summary.jsonl (dernière entrée par run, étude en
+        # cours ou interrompue), sinon summary.json (étude terminée)
+        summary_jsonl = study_results / "summary.jsonl"
         summary_file = study_results / "summary.json"
-        if summary_file.exists():
+        summary = {}
+        if summary_jsonl.exists():
+            with open(summary_jsonl, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        summary[entry['run']] = entry
+        elif summary_file.exists():
             with open(summary_file) as f:
-                summary = json.load(f)
-            
-            print(f"\n=== STATUS: {study_name} ===\n")
-            for run in summary:
+                summary = {entry['run']: entry for entry in json.load(f)}
+
+        # Runs sans entrée (en cours, pas encore lancés): fin de leur log.
+        # Une seule énumération du dossier
+        with os.scandir(study_results) as it:
+            run_dirs = {e.name: e.path for e in it
+                        if e.name.startswith('run_') and e.is_dir(follow_symlinks=False)}
+
+        names = sorted(summary.keys() | run_dirs.keys())
+        print(f"\n=== STATUS: {study_name} ===")
+        print(f"Runs trouvés: {len(names)}")
+        for name in names:
+            run = summary.get(name)
+            if run is not None:
                 status_icon = "✅" if run['status'] == "OK" else "❌"
-                print(f"{status_icon} {run['run']}: {run['parameter']} = {run['value']} [{run['status']}]")
-        else:
-            runs = list(study_results.glob("run_*"))
-            print(f"\n=== STATUS: {study_name} ===")
-            print(f"Runs trouvés: {len(runs)}")
-            for run in sorted(runs):
-                log = run / "run.log"
-                if log.exists():
-                    # Vérifier si terminé
-                    content = log.read_text()
-                    if "End" in content:
-                        print(f"  ✅ {run.name}")
-                    elif "FOAM FATAL" in content:
-                        print(f"  ❌ {run.name} (erreur)")
-                    else:
-                        print(f"  🔄 {run.name} (en cours)")
-                else:
-                    print(f"  ⏳ {run.name} (pas de log)")
+                params = ", ".join(f"{k} = {v}" for k, v in run['parameters'].items())
+                print(f"  {status_icon} {name}: {params} [{run['status']}]")
+                continue
+            try:
+                tail = read_log_tail(os.path.join(run_dirs[name], "run.log"))
+            except FileNotFoundError:
+                print(f"  ⏳ {name} (pas de log)")
+                continue
+            # Vérifier si terminé
+            if b"End" in tail:
+                print(f"  ✅ {name}")
+            elif b"FOAM FATAL" in tail:
+                print(f"  ❌ {name} (erreur)")
+            else:
+                print(f"  🔄 {name} (en cours)")
 
 
 # =============================================================================
@@ -735,10 +1170,14 @@ Exemples:
   %(prog)s create --name viscosity       Crée une nouvelle étude
   %(prog)s run --study viscosity         Lance une étude
   %(prog)s run --study viscosity --dry   Test sans exécution
+  %(prog)s run --study viscosity --jobs 4  Lance 4 simulations en parallèle
   %(prog)s status --study viscosity      Status d'une étude
         """
     )
     
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Masquer le détail des paramètres modifiés')
+
     subparsers = parser.add_subparsers(dest='command', help='Commande')
     
     # List
@@ -752,13 +1191,18 @@ Exemples:
     run_parser = subparsers.add_parser('run', help='Lance une étude')
     run_parser.add_argument('--study', required=True, help='Nom de l\'étude')
     run_parser.add_argument('--dry', action='store_true', help='Dry run (pas d\'exécution)')
+    run_parser.add_argument('--jobs', type=int, default=None,
+                            help='Simulations simultanées (remplace execution.parallel/max_parallel)')
     
     # Status
     status_parser = subparsers.add_parser('status', help='Status d\'une étude')
     status_parser.add_argument('--study', required=True, help='Nom de l\'étude')
     
     args = parser.parse_args()
-    
+
+    if args.quiet:
+        logger.setLevel(logging.WARNING)
+
     runner = StudyRunner()
     
     if args.command == 'list':
@@ -766,7 +1210,7 @@ Exemples:
     elif args.command == 'create':
         runner.create_study(args.name)
     elif args.command == 'run':
-        runner.run_study(args.study, dry_run=args.dry)
+        runner.run_study(args.study, dry_run=args.dry, jobs=args.jobs)
     elif args.command == 'status':
         runner.status(args.study)
     else:
@@ -12,12 +12,39 @@ Usage:
 import argparse
 import json
 import csv
+import math
+import os
 from pathlib import Path
 import sys
 
+from openfoam_params import parse_solver_log
+
 PROJECT_ROOT = Path(__file__).parent.parent
 RESULTS_DIR = PROJECT_ROOT / "results"
 
+# Colonnes du résumé CSV (ordre fixe)
+SUMMARY_COLUMNS = ('name', 'param_value', 'status', 'final_time', 'last_timestep')
+
+def _parse_log(content: str) -> tuple:
+    """Retourne (status, temps final) depuis (une partie d') un log solveur."""
+    if "End" in content:
+        # Dernier pas de temps lisible
+        for line in reversed(content.split('\n')):
+            if line.startswith("Time = "):
+                try:
+                    return "OK", float(line.split('=')[1].strip())
+                except ValueError:
+                    pass
+        return "OK", None
+    elif "FOAM FATAL" in content:
+        return "ERROR", None
+    return "RUNNING", None
+
+
+def get_run_status(log_file: Path) -> tuple:
+    """Lit le status d'un run depuis la fin de son log (voir parse_solver_log)."""
+    return parse_solver_log(log_file, _parse_log)
+
 
 def collect_results(study_name: str, generate_plots: bool = False):
     """Collecte les résultats d'une étude."""
@@ -32,12 +59,13 @@ def collect_results(study_name: str, generate_plots: bool = False):
     if config_file.exists():
         import yaml
         with open(config_file) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
     else:
         config = {}
     
-    # Trouver tous les runs
-    runs = sorted(study_dir.glob("run_*"))
+    # Trouver tous les runs (scandir: le type vient de getdents, sans stat)
+    with os.scandir(study_dir) as it:
+        runs = sorted(Path(e.path) for e in it if e.name.startswith("run_") and e.is_dir())
     
     if not runs:
         print(f"❌ Aucun run trouvé dans {study_dir}")
@@ -47,6 +75,7 @@ def collect_results(study_name: str, generate_plots: bool = False):
     print(f"Runs trouvés: {len(runs)}")
     
     results = []
+    rows = []  # lignes CSV, construites au fil de la collecte
     
     for run_dir in runs:
         run_data = {'name': run_dir.name}
@@ -57,32 +86,30 @@ def collect_results(study_name: str, generate_plots: bool = False):
             run_data['param_value'] = parts[-1]
         
         # Vérifier le status
-        log_file = run_dir / "run.log"
-        if log_file.exists():
-            content = log_file.read_text()
-            if "End" in content:
-                run_data['status'] = "OK"
-                # Extraire le temps final
-                for line in content.split('\n'):
-                    if line.startswith("Time = "):
-                        try:
-                            run_data['final_time'] = float(line.split('=')[1].strip())
-                        except:
-                            pass
-            elif "FOAM FATAL" in content:
-                run_data['status'] = "ERROR"
-            else:
-                run_data['status'] = "RUNNING"
-        else:
-            run_data['status'] = "NO_LOG"
+        try:
+            status, final_time = get_run_status(run_dir / "run.log")
+        except FileNotFoundError:
+            status, final_time = "NO_LOG", None
+        run_data['status'] = status
+        # Extraire le temps final
+        if final_time is not None:
+            run_data['final_time'] = final_time
         
-        # Chercher les derniers résultats temporels
-        time_dirs = [d for d in run_dir.iterdir() if d.is_dir() and d.name.replace('.', '').isdigit()]
-        if time_dirs:
-            last_time = max(time_dirs, key=lambda d: float(d.name))
-            run_data['last_timestep'] = last_time.name
+        # Chercher les derniers résultats temporels (noms "0.005", "1e-05"...)
+        with os.scandir(run_dir) as it:
+            times = {}
+            for e in it:
+                try:
+                    t = float(e.name)
+                except ValueError:
+                    continue
+                if math.isfinite(t) and e.is_dir():
+                    times[e.name] = t
+        if times:
+            run_data['last_timestep'] = max(times, key=times.get)
         
         results.append(run_data)
+        rows.append(tuple(run_data.get(col, '') for col in SUMMARY_COLUMNS))
         
         status_icon = "✅" if run_data['status'] == "OK" else "❌" if run_data['status'] == "ERROR" else "🔄"
         print(f"  {status_icon} {run_dir.name}: {run_data.get('status', '?')}")
@@ -91,9 +118,9 @@ def collect_results(study_name: str, generate_plots: bool = False):
     csv_file = study_dir / "results_summary.csv"
     if results:
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=results[0].keys())
-            writer.writeheader()
-            writer.writerows(results)
+            writer = csv.writer(f)
+            writer.writerow(SUMMARY_COLUMNS)
+            writer.writerows(rows)
         print(f"\n📊 Résumé sauvegardé: {csv_file}")
     
     # Générer plots si demandé
@@ -8,60 +8,172 @@ Usage:
 """
 
 import argparse
+import functools
+import os
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from openfoam_params import read_log_tail, get_openfoam_env
+
+# Optional: wake up on run.log close events instead of waiting a full interval
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
 PROJECT_ROOT = Path(__file__).parent.parent
 RESULTS_DIR = PROJECT_ROOT / "results"
+OF_ENV_CACHE = PROJECT_ROOT / "logs" / ".of_env.json"  # shared with parametric_runner
+CONDA_ENV_NAME = "electrochemistry"
 
 def is_simulation_complete(run_dir: Path) -> bool:
-    """Check if simulation is complete (has 'End' in run.log)."""
-    log_file = run_dir / "run.log"
-    if not log_file.exists():
-        return False
+    """Check if simulation is complete (has 'End' in run.log).
+
+    The markers are written at the end of the log: only its tail is read.
+    """
     try:
-        content = log_file.read_text()
-        return "End" in content or "Finalising" in content
-    except:
+        tail = read_log_tail(run_dir / "run.log")
+    except OSError:
         return False
+    return b"End" in tail or b"Finalising" in tail
 
 def has_vtk(run_dir: Path) -> bool:
     """Check if VTK conversion is done."""
-    vtk_dir = run_dir / "VTK"
-    return vtk_dir.exists() and len(list(vtk_dir.glob("*.vtk"))) > 0
+    try:
+        with os.scandir(run_dir / "VTK") as it:
+            return any(e.name.endswith(".vtk") for e in it)
+    except OSError:
+        return False
 
 def has_gif(run_dir: Path, study_dir: Path) -> bool:
     """Check if GIF is generated."""
     gif_path = study_dir / "gifs" / f"{run_dir.name}.gif"
     return gif_path.exists()
 
+@functools.lru_cache(maxsize=None)
+def get_conda_env() -> dict:
+    """Return the activated conda environment, resolved once per process.
+
+    Like get_openfoam_env: the activation scripts are sourced by a single
+    bash, then every GIF is generated by running python3 directly.
+    """
+    out = subprocess.run(
+        ['bash', '-c', f'source ~/miniconda3/etc/profile.d/conda.sh '
+                       f'&& conda activate {CONDA_ENV_NAME} && env -0'],
+        check=True, capture_output=True
+    ).stdout
+    return dict(item.split('=', 1)
+                for item in out.decode(errors='replace').split('\0') if '=' in item)
+
+def run_quiet(args, env, cwd=None) -> bool:
+    """Run a command without a shell, discarding its output."""
+    try:
+        result = subprocess.run(args, env=env, cwd=cwd,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        return False
+    return result.returncode == 0
+
 def convert_to_vtk(run_dir: Path) -> bool:
     """Convert OpenFOAM results to VTK."""
-    cmd = f"source /opt/openfoam13/etc/bashrc && foamToVTK -case {run_dir} > /dev/null 2>&1"
-    result = subprocess.run(cmd, shell=True, executable='/bin/bash')
-    return result.returncode == 0
+    try:
+        env = get_openfoam_env(OF_ENV_CACHE)
+    except subprocess.CalledProcessError:
+        return False
+    return run_quiet(['foamToVTK', '-case', str(run_dir)], env)
 
 def generate_gif(run_dir: Path) -> bool:
     """Generate GIF for a run."""
-    cmd = f"source ~/miniconda3/etc/profile.d/conda.sh && conda activate electrochemistry && python3 scripts/create_vof_gif.py --run {run_dir} > /dev/null 2>&1"
-    result = subprocess.run(cmd, shell=True, executable='/bin/bash', cwd=PROJECT_ROOT)
-    return result.returncode == 0
+    try:
+        env = get_conda_env()
+    except subprocess.CalledProcessError:
+        return False
+    return run_quiet(['python3', 'scripts/create_vof_gif.py', '--run', str(run_dir)],
+                     env, cwd=PROJECT_ROOT)
+
+if Observer is not None:
+    class RunLogHandler(FileSystemEventHandler):
+        """Wake the watch loop when a run.log is closed (solver exit)."""
+
+        def __init__(self, wake: threading.Event):
+            super().__init__()
+            self.wake = wake
+
+        def on_closed(self, event):
+            if not event.is_directory and os.path.basename(event.src_path) == "run.log":
+                self.wake.set()
+
+def process_run(run_dir: Path, study_dir: Path):
+    """Convert a completed run to VTK, then generate its GIF.
+
+    Runs in a worker thread: progress lines are returned rather than printed
+    so that the output of concurrent runs does not interleave.
+
+    Returns:
+        (success, lines)
+    """
+    lines = []
+
+    # Convert to VTK if needed
+    if not has_vtk(run_dir):
+        ok = convert_to_vtk(run_dir)
+        lines.append(f"  Converting to VTK... {'OK' if ok else 'FAILED'}")
+        if not ok:
+            return False, lines
 
-def watch_study(study_name: str, interval: int = 30):
-    """Watch study and generate GIFs as simulations complete."""
+    # Generate GIF if needed
+    if not has_gif(run_dir, study_dir):
+        ok = generate_gif(run_dir)
+        lines.append(f"  Generating GIF... {'OK' if ok else 'FAILED'}")
+        return ok, lines
+
+    return True, lines
+
+def watch_study(study_name: str, interval: int = 30, jobs: int = None):
+    """Watch study and generate GIFs as simulations complete.
+
+    Completed runs are converted in parallel (``jobs`` workers, half the
+    CPUs by default); a run is never submitted twice while in flight.
+    """
     study_dir = RESULTS_DIR / study_name
 
     print(f"=== Watching study: {study_name} ===")
     print(f"Checking every {interval} seconds...")
     print(f"Press Ctrl+C to stop\n")
 
+    # With watchdog, a finished run triggers a scan right away; the interval
+    # remains as a fallback (e.g. filesystems without inotify)
+    wake = threading.Event()
+    observer = None
+    if Observer is not None:
+        observer = Observer()
+        observer.schedule(RunLogHandler(wake), str(study_dir), recursive=True)
+        observer.start()
+
     processed = set()
+    complete = set()  # runs already seen complete: their log is not re-read
+    pending = {}  # run_name -> future of process_run
+    executor = ThreadPoolExecutor(max_workers=jobs or max(1, (os.cpu_count() or 2) // 2))
 
     while True:
+        # Collect finished jobs (a failed run is retried on a later scan)
+        for run_name, future in list(pending.items()):
+            if future.done():
+                del pending[run_name]
+                ok, lines = future.result()
+                print(f"\n[{run_name}]")
+                print("\n".join(lines) if lines else "  Already processed")
+                if ok:
+                    processed.add(run_name)
+
         # Find all run directories
-        run_dirs = sorted([d for d in study_dir.iterdir()
-                          if d.is_dir() and d.name.startswith('run_')])
+        with os.scandir(study_dir) as it:
+            run_dirs = sorted(Path(e.path) for e in it
+                              if e.name.startswith('run_') and e.is_dir())
 
         completed = 0
         with_gif = 0
@@ -69,32 +181,16 @@ def watch_study(study_name: str, interval: int = 30):
         for run_dir in run_dirs:
             run_name = run_dir.name
 
-            if is_simulation_complete(run_dir):
+            if run_name in complete or is_simulation_complete(run_dir):
+                complete.add(run_name)
                 completed += 1
 
-                # Process if not already done
-                if run_name not in processed:
+                # Process if not already done nor in flight
+                if run_name not in processed and run_name not in pending:
                     print(f"\n[NEW] {run_name} completed!")
-
-                    # Convert to VTK if needed
-                    if not has_vtk(run_dir):
-                        print(f"  Converting to VTK...", end=" ", flush=True)
-                        if convert_to_vtk(run_dir):
-                            print("OK")
-                        else:
-                            print("FAILED")
-                            continue
-
-                    # Generate GIF if needed
-                    if not has_gif(run_dir, study_dir):
-                        print(f"  Generating GIF...", end=" ", flush=True)
-                        if generate_gif(run_dir):
-                            print("OK")
-                            processed.add(run_name)
-                        else:
-                            print("FAILED")
-                    else:
-                        processed.add(run_name)
+                    future = executor.submit(process_run, run_dir, study_dir)
+                    future.add_done_callback(lambda _: wake.set())
+                    pending[run_name] = future
 
                 if has_gif(run_dir, study_dir):
                     with_gif += 1
@@ -108,17 +204,25 @@ def watch_study(study_name: str, interval: int = 30):
             print(f"\n\n=== All {len(run_dirs)} simulations complete with GIFs! ===")
             break
 
-        time.sleep(interval)
+        wake.wait(interval)
+        wake.clear()
+
+    executor.shutdown()
+    if observer is not None:
+        observer.stop()
+        observer.join()
 
 def main():
     parser = argparse.ArgumentParser(description="Watch study and generate GIFs")
     parser.add_argument('--study', required=True, help='Study name to watch')
     parser.add_argument('--interval', type=int, default=30, help='Check interval in seconds')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Runs converted in parallel (default: half the CPUs)')
 
     args = parser.parse_args()
 
     try:
-        watch_study(args.study, args.interval)
+        watch_study(args.study, args.interval, args.jobs)
     except KeyboardInterrupt:
         print("\n\nStopped by user.")
 
@@ -0,0 +1,67 @@
+"""Tests for the cellZones label parsing of generate_alpha_field."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from generate_alpha_field import parse_label_block, read_cell_zone_labels
+
+CELL_ZONES = """FoamFile
+{
+    format      ascii;
+    class       regIOobject;
+    location    "constant/polyMesh";
+    object      cellZones;
+}
+
+2
+(
+buse
+{
+cellLabels      List<label> 
+3
+(
+4
+7
+9
+)
+;
+}
+
+empty
+{
+cellLabels      List<label> 
+0
+(
+)
+;
+}
+)
+"""
+
+
+def write_case(tmp_path):
+    mesh_dir = tmp_path / "constant" / "polyMesh"
+    mesh_dir.mkdir(parents=True)
+    (mesh_dir / "cellZones").write_text(CELL_ZONES)
+    return tmp_path
+
+
+def test_read_cell_zone_labels(tmp_path):
+    labels = read_cell_zone_labels(write_case(tmp_path), "buse")
+    assert labels.tolist() == [4, 7, 9]
+
+
+def test_read_empty_cell_zone(tmp_path):
+    labels = read_cell_zone_labels(write_case(tmp_path), "empty")
+    assert labels.size == 0
+
+
+def test_read_missing_cell_zone(tmp_path):
+    labels = read_cell_zone_labels(write_case(tmp_path), "nozzle")
+    assert labels.size == 0
+
+
+def test_parse_whitespace_only_block():
+    assert parse_label_block(b"0\n(\n)\n", 0).size == 0